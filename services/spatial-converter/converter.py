@@ -4,10 +4,18 @@ PDAL 및 py3dtiles 기반 3D 데이터 변환 로직
 """
 
 import os
+import re
+import math
 import json
+import time
 import subprocess
 import tempfile
 import shutil
+import threading
+import types
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from enum import Enum
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -15,9 +23,436 @@ from typing import Optional, Callable
 
 import structlog
 
+try:
+    # PDAL Python 바인딩 (설치 시 subprocess 없이 in-process로 메타데이터 조회)
+    import pdal
+except ImportError:
+    pdal = None
+
+try:
+    # JSON 직렬화 가속 (C 구현) — 미설치 시 stdlib json 사용
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # 선택적 JIT 가속 — 미설치 시 NumPy 벡터 연산으로 fallback
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 logger = structlog.get_logger()
 
 
+def _write_file_once(path: Path, data: bytes) -> None:
+    """open/write/close 시스템 콜 한 세트로 파일 기록
+
+    io.BufferedWriter 래퍼 할당 없이 데이터 전체를 단일 write()로 내보냄
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """기계 소비용 JSON 직렬화 (compact)
+
+    tileset.json/pipeline JSON은 뷰어와 PDAL만 읽으므로 들여쓰기가 불필요 —
+    pretty-printer 순회를 생략하고, orjson이 있으면 C 구현으로 인코딩
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(data):
+    """JSON 파싱 (orjson 우선)
+
+    pdal info --stats / pipeline 메타데이터는 수 MB까지 커질 수 있어
+    C(Rust) 파서의 2~5배 처리량 차이가 체감됨 — str/bytes 모두 허용
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Z-up → Y-up 좌표계 변환 행렬 (X축 기준 -90도 회전: X'=X, Y'=Z, Z'=-Y, row-major)
+# Three.js는 Y-up을 사용하므로 투영 좌표계(Z-up) 데이터에 적용
+ZUP_TO_YUP_MATRIX = "1 0 0 0  0 0 1 0  0 -1 0 0  0 0 0 1"
+
+# OBJ 텍스처로 취급하는 이미지 확장자 매칭 (import 시 1회 컴파일)
+IMG_RE = re.compile(r"\.(jpe?g|png|tiff?|bmp)$", re.IGNORECASE)
+
+# CLI 도구 설치 경로 프로브 (import 시 1회)
+# 미설치 도구는 spawn 시도(execvp + PATH 탐색 + 예외 unwinding) 자체를 생략
+_OBJ2GLTF = shutil.which("obj2gltf")
+_GLTFPACK = shutil.which("gltfpack")
+_NPX = shutil.which("npx")
+
+# OBJ 정점 라인 매칭 (import 시 1회 컴파일, 바이트 패턴)
+# XYZ: 좌표 토큰 3개만 — np.fromregex용 (그룹 수 = dtype 필드 수)
+# LINE: 좌표 + 잔여 꼬리(색상 등) — 재작성 시 원본 보존용
+_OBJ_V_XYZ_RE = re.compile(rb'(?m)^v[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)')
+_OBJ_V_LINE_RE = re.compile(rb'(?m)^v[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)([^\n]*)$')
+
+# OBJ 헤더의 mtllib 선언 / MTL의 텍스처 맵 참조 (바이트 패턴)
+_OBJ_MTLLIB_RE = re.compile(rb'(?m)^mtllib[ \t]+([^\r\n]+)')
+_MTL_MAP_RE = re.compile(rb'(?m)^[ \t]*(?:map_\w+|bump|disp|decal)[ \t]+([^\r\n]+)')
+
+# py3dtiles 등 외부 도구가 출력하는 진행률("42%", "42.5 %") 추출용
+_PROGRESS_PCT_RE = re.compile(rb'(\d{1,3})(?:\.\d+)?\s*%')
+
+# OBJ 타일셋 JSON 템플릿 (import 시 1회 직렬화)
+# 호출마다 dict 구성 + JSON 인코더 순회를 반복하지 않고 bytes.replace 1회로 생성
+_OBJ_TILESET_TEMPLATE = json.dumps({
+    "asset": {
+        "version": "1.0",
+        "tilesetVersion": "1.0.0",
+        "extras": {
+            "format": "obj",
+            "note": "OBJ 파일은 뷰어에서 별도 로더 필요"
+        }
+    },
+    "geometricError": 500,
+    "root": {
+        "boundingVolume": {
+            "box": [0, 0, 0, 100, 0, 0, 0, 100, 0, 0, 0, 100]
+        },
+        "geometricError": 100,
+        "refine": "ADD",
+        "content": {
+            "uri": "__URI__"
+        }
+    }
+}, separators=(",", ":")).encode()
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _wgs84_to_local_kernel(xyz, cx, cy, mlon, mlat):  # pragma: no cover
+        """(N,3) 좌표 배열에 도→미터 아핀 변환을 멀티코어로 in-place 적용"""
+        for i in prange(xyz.shape[0]):
+            xyz[i, 0] = (xyz[i, 0] - cx) * mlon
+            xyz[i, 1] = (xyz[i, 1] - cy) * mlat
+else:
+    _wgs84_to_local_kernel = None
+
+
+# 좌표계 분류 규칙 테이블 — bounds 파생 지표(dict)를 받아 불리언 반환
+# 분기 체인 대신 한 곳에 모아 규칙 추가/검증이 쉬움
+_COORD_RULES = (
+    # X/Y 범위가 매우 작고 Z가 위도 범위 (좌표 축 뒤바뀜)
+    ("is_swapped", lambda m: (
+        m["x_range"] < 1 and m["y_range"] < 1 and
+        20 <= m["minz"] <= 70 and 20 <= m["maxz"] <= 70)),
+    # 표준 지리 좌표 (-180~180, -90~90), 10도 이내 범위
+    ("is_standard_geo", lambda m: (
+        -180 <= m["minx"] <= 180 and -180 <= m["maxx"] <= 180 and
+        -90 <= m["miny"] <= 90 and -90 <= m["maxy"] <= 90 and
+        m["x_range"] < 10 and m["y_range"] < 10)),
+    # 한국 TM 좌표계 (EPSG:5186, 5187 등) — 높이 1km 이내
+    ("is_korea_tm", lambda m: (
+        100000 <= m["minx"] <= 700000 and 100000 <= m["maxx"] <= 700000 and
+        100000 <= m["miny"] <= 700000 and 100000 <= m["maxy"] <= 700000 and
+        m["z_range"] < 1000)),
+    # UTM 등 투영 좌표계 (미터 단위) — 높이 5km 이내
+    ("is_projected", lambda m: (
+        10000 <= abs(m["minx"]) <= 10000000 and
+        10000 <= abs(m["miny"]) <= 10000000 and
+        m["z_range"] < 5000)),
+)
+
+
+# 모든 tileset.json이 공유하는 asset 블록 (불변 — 호출마다 재구성하지 않음)
+_TILESET_ASSET = types.MappingProxyType({
+    "version": "1.0",
+    "tilesetVersion": "1.0.0"
+})
+
+
+# 단일 타일 tileset.json의 고정 골격 — 가변 leaf만 직렬화해 끼워 넣음
+# (호출마다 중첩 dict 구성 + 전체 트리 직렬화 순회를 반복하지 않음)
+_TILESET_ASSET_BYTES = _json_dumps_bytes(dict(_TILESET_ASSET))
+_TILESET_TEMPLATE = (
+    b'{"asset":%b,"geometricError":%b,'
+    b'"root":{"boundingVolume":%b,"geometricError":%b,"refine":"ADD",'
+    b'"content":{"uri":%b}%b}}'
+)
+
+
+def _render_tileset_bytes(
+    bounding_volume: dict,
+    root_geometric_error: float,
+    uri: str,
+    transform: Optional[list] = None,
+    extras: dict = None,
+) -> bytes:
+    """공유 골격에서 단일 타일 tileset.json bytes 생성
+
+    세 tileset 생성기가 같은 구조를 각자 리터럴로 만들던 것을 한 곳으로
+    모음 — 차이 나는 leaf(boundingVolume/uri/transform/extras)만
+    개별 직렬화해 사전 직렬화된 템플릿에 %b로 채움
+    """
+    asset_bytes = (_json_dumps_bytes({**_TILESET_ASSET, "extras": extras})
+                   if extras else _TILESET_ASSET_BYTES)
+    root_tail = (b',"transform":' + _json_dumps_bytes(transform)) if transform else b""
+    return _TILESET_TEMPLATE % (
+        asset_bytes,
+        _json_dumps_bytes(root_geometric_error * 5),
+        _json_dumps_bytes(bounding_volume),
+        _json_dumps_bytes(root_geometric_error),
+        _json_dumps_bytes(uri),
+        root_tail,
+    )
+
+
+def _build_root_transforms_batch(lons, lats, alts):
+    """여러 중심점의 GLB→ECEF 변환을 한 번의 NumPy 패스로 계산
+
+    반환: (N, 16) float64 배열 — 각 행은 column-major 4x4 행렬
+    (레이아웃/좌표계 유도는 _enu_to_ecef_matrix docstring 참고).
+    원점별 스칼라 삼각함수 N회 대신 배열 단위 sin/cos 4회로 처리하므로
+    배치 메타데이터 생성(convert_many 등)에서 파이썬 오버헤드가 원점
+    수와 무관하게 상수로 떨어짐. 단건 경로도 길이 1 배열로 이 함수를
+    호출해 수식의 단일 출처를 유지
+    """
+    import numpy as np
+
+    lon_rad = np.radians(np.asarray(lons, dtype=np.float64))
+    lat_rad = np.radians(np.asarray(lats, dtype=np.float64))
+    alt = np.asarray(alts, dtype=np.float64)
+
+    # WGS84 타원체 파라미터
+    a = 6378137.0  # 적도 반경
+    f = 1 / 298.257223563  # 편평률
+    e2 = 2 * f - f * f  # 이심률 제곱
+
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    sin_lon = np.sin(lon_rad)
+    cos_lon = np.cos(lon_rad)
+
+    # 곡률 반경 및 중심점 ECEF 좌표
+    N = a / np.sqrt(1 - e2 * sin_lat * sin_lat)
+    x = (N + alt) * cos_lat * cos_lon
+    y = (N + alt) * cos_lat * sin_lon
+    z = (N * (1 - e2) + alt) * sin_lat
+
+    out = np.zeros((lon_rad.shape[0], 16), dtype=np.float64)
+    # col0 = East, col1 = Up, col2 = -North, col3 = translation
+    out[:, 0] = -sin_lon
+    out[:, 1] = cos_lon
+    out[:, 4] = cos_lat * cos_lon
+    out[:, 5] = cos_lat * sin_lon
+    out[:, 6] = sin_lat
+    out[:, 8] = sin_lat * cos_lon
+    out[:, 9] = sin_lat * sin_lon
+    out[:, 10] = -cos_lat
+    out[:, 12] = x
+    out[:, 13] = y
+    out[:, 14] = z
+    out[:, 15] = 1.0
+    return out
+
+
+@lru_cache(maxsize=64)
+def _enu_to_ecef_matrix(lon: float, lat: float, alt: float) -> tuple:
+    """WGS84 중심점 기준 GLB→ECEF column-major 4x4 행렬 (16개 float tuple)
+
+    Cesium의 Transforms.eastNorthUpToFixedFrame과 동일한 ENU 기저에
+    GLB(Y-up) → ENU 회전을 결합. 같은 중심점으로 재변환 시 삼각함수
+    계산을 반복하지 않도록 lru_cache로 메모이즈 (튜플이므로 불변 공유 안전)
+
+    GLB (obj2gltf --inputUpAxis Z 변환 후):
+      X = East, Y = Up, Z = South (Y-up 좌표계)
+
+    ENU (East-North-Up) 좌표계:
+      X = East, Y = North, Z = Up
+
+    GLB → ENU 회전 (모델 좌표 → 로컬 ENU):
+      ENU_X = model_X (East)
+      ENU_Y = -model_Z (model_Z=South → ENU_Y=North)
+      ENU_Z = model_Y (model_Y=Up → ENU_Z=Up)
+
+    ENU→ECEF 기저 벡터:
+      East  = [-sin(lon), cos(lon), 0]
+      North = [-sin(lat)*cos(lon), -sin(lat)*sin(lon), cos(lat)]
+      Up    = [cos(lat)*cos(lon), cos(lat)*sin(lon), sin(lat)]
+
+    결합 변환 (GLB → ECEF):
+      ECEF = East * model_X - North * model_Z + Up * model_Y
+
+    Column-major 배치:
+      col0 = East (model_X 계수)
+      col1 = Up (model_Y 계수)
+      col2 = -North (model_Z 계수, South 방향이므로 부호 반전)
+      col3 = translation (중심점 ECEF 좌표)
+    """
+    return tuple(map(float, _build_root_transforms_batch([lon], [lat], [alt])[0]))
+
+
+def _image_dimensions(head: bytes) -> Optional[tuple]:
+    """PNG/JPEG blob 선두 바이트에서 (width, height) 추출 — 실패 시 None
+
+    이미지를 디코드하지 않음: PNG는 IHDR 고정 오프셋, JPEG는 SOF 마커의
+    높이/너비 필드만 읽음
+    """
+    import struct
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and len(head) >= 24:
+        w, h = struct.unpack_from('>II', head, 16)
+        return (w, h)
+    if head[:2] == b'\xff\xd8':
+        i = 2
+        n = len(head)
+        while i + 9 < n:
+            if head[i] != 0xFF:
+                i += 1
+                continue
+            marker = head[i + 1]
+            if 0xC0 <= marker <= 0xC3:  # SOF0..SOF3
+                h, w = struct.unpack_from('>HH', head, i + 5)
+                return (w, h)
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                i += 2
+                continue
+            seg_len = struct.unpack_from('>H', head, i + 2)[0]
+            i += 2 + seg_len
+    return None
+
+
+def _glb_textures_exceed(glb_path: Path, limit: int = 2048) -> bool:
+    """GLB 내 텍스처 중 limit(px)를 넘는 것이 있는지 헤더만 읽어 판정
+
+    JSON chunk의 images → bufferViews를 따라가 각 blob의 앞부분만 읽음.
+    판정 불가(파싱 실패/외부 URI/미지원 포맷) 시 True를 반환해 호출부가
+    리사이즈 단계를 보수적으로 유지하도록 함
+    """
+    import struct
+    try:
+        with open(glb_path, 'rb') as f:
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != b'glTF':
+                return True
+
+            chunk_len, chunk_type = struct.unpack('<II', f.read(8))
+            if chunk_type != 0x4E4F534A:  # 'JSON'
+                return True
+            gltf = _json_loads(f.read(chunk_len))
+
+            images = gltf.get('images') or []
+            if not images:
+                return False
+
+            bin_header = f.read(8)
+            if len(bin_header) < 8:
+                return True
+            _bin_len, bin_type = struct.unpack('<II', bin_header)
+            if bin_type != 0x004E4942:  # 'BIN\0'
+                return True
+            bin_start = f.tell()
+
+            buffer_views = gltf.get('bufferViews') or []
+            for image in images:
+                bv_index = image.get('bufferView')
+                if bv_index is None:
+                    return True  # 외부 URI 이미지 — 크기 판정 불가
+                bv = buffer_views[bv_index]
+                f.seek(bin_start + bv.get('byteOffset', 0))
+                head = f.read(min(bv.get('byteLength', 0), 65536))
+                size = _image_dimensions(head)
+                if size is None or max(size) > limit:
+                    return True
+        return False
+    except Exception as e:
+        logger.warning("glb_texture_probe_failed", error=str(e))
+        return True
+
+
+# 융합 GLB 후처리 스크립트 (리사이즈+WebP+센터링+Draco를 Node 1회 실행으로)
+_GLB_PIPELINE_SCRIPT = Path(__file__).parent / "scripts" / "glb_pipeline.mjs"
+
+# 스트리밍 실행 시 PDAL이 선할당 후 재사용하는 포인트 버퍼 크기
+# (상주 메모리 상한 ≈ chunk 크기 × 포인트당 바이트 수 — 환경변수로 튜닝 가능)
+PDAL_STREAM_CHUNK_SIZE = int(os.getenv("PDAL_STREAM_CHUNK", "500000"))
+
+# E57 중심점 → (lon, lat) 선택 전략 테이블
+# 키: (is_geographic, is_swapped_geo, is_korea_tm) — 분기 캐스케이드 대신
+# dict 1회 조회. 테이블에 없는 조합은 경위도 미산출(None)
+_CENTER_LONLAT_RULES = {
+    # 표준 지리 좌표: X=lon, Y=lat
+    (True, False, False): lambda cx, cy, cz: (cx, cy),
+    # 좌표가 뒤바뀐 경우: X=lon, Z=lat (Y는 altitude)
+    (True, True, False): lambda cx, cy, cz: (cx, cz),
+    # 한국 TM → WGS84 변환 (근사치)
+    (False, False, True): lambda cx, cy, cz: (
+        127.0 + (cx - 200000) / 89000,
+        38.0 + (cy - 500000) / 111000,
+    ),
+}
+
+# 고정 형태 파이프라인 템플릿 (import 시 1회 직렬화)
+# E57→LAS는 파일명 두 개 외에 형태가 불변 — 요청마다 dict 구성과 JSON
+# 인코더 순회를 반복하지 않고 bytes.replace 두 번으로 완성
+# (COPC 경로는 reader threads/writer 선택이 런타임에 갈려 dict 구성 유지)
+_E57_TO_LAS_TEMPLATE = _json_dumps_bytes({
+    "pipeline": [
+        {
+            "type": "readers.e57",
+            "filename": "__SRC__"
+        },
+        {
+            "type": "writers.las",
+            "filename": "__DST__",
+            "compression": "none",
+            "minor_version": 4
+        }
+    ]
+})
+
+# 스트리밍 실행 가능한 stage 화이트리스트 (CLI fallback의 --stream 판정용)
+# 이 변환기가 구성하는 stage만 나열 — 목록 밖 stage가 섞이면 기본 모드 유지.
+# writers.ply(헤더에 정점 수 선기록)와 writers.copc(전역 extent로 옥트리
+# 구성)는 스트리밍 불가 — 포함하면 pdal pipeline --stream이 hard error
+_STREAMABLE_STAGES = frozenset({
+    "readers.las", "readers.ply", "readers.e57",
+    "filters.assign", "filters.transformation", "filters.decimation",
+    "filters.voxeldownsize", "filters.stats",
+    "writers.las", "writers.null",
+})
+
+
+def _execute_pipeline_json(pipeline_json: str) -> tuple[bool, str, int]:
+    """프로세스 풀 워커: 파이프라인 JSON 하나를 실행
+
+    모듈 수준 함수로 유지해야 pickle 가능 (self를 워커로 보내지 않음).
+
+    Returns:
+        (success, error, point_count) 튜플
+    """
+    try:
+        if pdal is not None:
+            pipeline = pdal.Pipeline(pipeline_json)
+            if pipeline.streamable:
+                count = pipeline.execute_streaming(chunk_size=PDAL_STREAM_CHUNK_SIZE)
+            else:
+                count = pipeline.execute()
+            return True, "", count
+
+        result = subprocess.run(
+            ["pdal", "pipeline", "--stdin"],
+            input=pipeline_json,
+            capture_output=True,
+            text=True,
+            timeout=3600
+        )
+        if result.returncode != 0:
+            return False, result.stderr[:500] if result.stderr else "PDAL 실행 실패", 0
+        return True, "", 0
+    except Exception as e:
+        return False, str(e), 0
+
+
 class ConversionType(str, Enum):
     """변환 타입"""
     E57_TO_PLY = "e57_to_ply"
@@ -33,6 +468,25 @@ class ConversionType(str, Enum):
     E57_TO_3DTILES = "e57_to_3dtiles"
 
 
+@dataclass
+class _PipelineContext:
+    """E57 파이프라인 빌더 입력 — 변환 형상을 결정하는 값들의 요약"""
+    source: Path
+    output_path: Path
+    output_format: str
+    voxel_size: float
+    point_count: int
+    bbox: Optional[tuple]
+    has_valid_bounds: bool
+    is_geographic: bool
+    is_korea_tm: bool
+    is_projected: bool
+    has_color: bool
+    is_16bit_color: bool
+    transform_coords: bool
+    force_default_color: bool = False
+
+
 @dataclass
 class ConversionStatus:
     """변환 상태"""
@@ -56,6 +510,56 @@ class ConversionResult:
 class SpatialConverter:
     """3D 데이터 변환기"""
 
+    # Node CLI 실행 prefix 캐시 (프로세스 수명 동안 유지)
+    _cli_prefix_cache: dict = {}
+
+    @classmethod
+    def _cli_prefix(cls, tool: str) -> list:
+        """CLI 도구 실행 prefix 반환 (경로 해석 결과 캐시)
+
+        npx는 호출할 때마다 Node를 새로 띄워 패키지를 재해석하므로,
+        전역 설치된 실행 파일을 찾으면 직접 실행하여 호출당 수백 ms를 절약.
+        미설치 시 npx 경유로 fallback.
+        """
+        if tool in cls._cli_prefix_cache:
+            return cls._cli_prefix_cache[tool]
+
+        direct = shutil.which(tool)
+        if direct is None and _NPX is None:
+            # 전역 설치도 npx도 없음 — 호출부 spawn은 FileNotFoundError로
+            # 즉시 실패하므로 원인을 1회만 로깅해 둠
+            logger.warning("cli_tool_unavailable", tool=tool)
+        prefix = [direct] if direct else ["npx", tool]
+        cls._cli_prefix_cache[tool] = prefix
+        logger.info("cli_prefix_resolved", tool=tool, prefix=prefix)
+        return prefix
+
+    def _run_glb_pipeline_script(self, src: Path, dst: Path) -> bool:
+        """융합 Node 스크립트로 GLB 후처리 (문서 1회 로드/기록)
+
+        scripts/glb_pipeline.mjs가 리사이즈+WebP 압축+센터링(+Draco)을
+        한 프로세스에서 적용. 스크립트/Node/의존성 미비 시 False를 반환해
+        호출부가 단계별 gltf-transform CLI로 fallback하도록 함
+        """
+        if not _GLB_PIPELINE_SCRIPT.exists():
+            return False
+        try:
+            result = subprocess.run(
+                ["node", str(_GLB_PIPELINE_SCRIPT), str(src), str(dst)],
+                capture_output=True,
+                text=True,
+                timeout=600
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as e:
+            logger.warning("glb_pipeline_script_error", error=str(e))
+            return False
+
+        if result.returncode == 0 and dst.exists():
+            return True
+        logger.warning("glb_pipeline_script_failed",
+                      stderr=result.stderr[:300] if result.stderr else "")
+        return False
+
     def __init__(self, storage_path: str = "/var/lib/storage"):
         self.storage_path = Path(storage_path)
         self.output_base = Path(os.getenv("OUTPUT_PATH", "/app/output"))
@@ -65,6 +569,36 @@ class SpatialConverter:
         self.output_base.mkdir(parents=True, exist_ok=True)
         self.temp_path.mkdir(parents=True, exist_ok=True)
 
+        # 좌표계 감지 결과 캐시: (경로, mtime, size) → 감지 결과
+        # 같은 파일이 다단계 변환(E57→PLY→3D Tiles 등)에서 반복 스캔되는 것을 방지
+        self._coord_cache: dict[tuple, dict] = {}
+
+        # 파일 메타데이터(summary) 캐시: (경로, mtime, size) → summary dict
+        self._metadata_cache: dict[tuple, dict] = {}
+
+        # OBJ 인제스트 캐시: (경로, mtime, size) → 변환 완료된 GLB 경로
+        self._glb_cache: dict[tuple, str] = {}
+
+        # pdal info CLI 결과 캐시: (경로, mtime, size, flag) → 파싱된 JSON
+        self._pdal_info_cache: dict[tuple, dict] = {}
+
+        # 색상 감지 결과 캐시 — 무색 파일의 재변환 시 재프로브 방지
+        # (부정 결과도 캐시해야 colorless PLY/E57 재변환이 공짜가 됨)
+        self._color_cache: dict[tuple, dict] = {}
+
+        # 스토리지 인덱스 캐시: (생성 시각, 디렉토리 mtime, {확장자: 항목들})
+        self._storage_index: Optional[tuple] = None
+
+        # OBJ 공간 정보(AABB) 캐시: (경로, mtime, size) → spatial_info dict
+        # 재시도/포맷 대안 변환에서 전체 정점 스캔 반복 방지
+        self._obj_spatial_cache: dict[tuple, dict] = {}
+
+        # 파일 복사 전용 공유 스레드 풀 — 변환마다 풀을 새로 만들면
+        # 스레드 기동 비용이 반복되므로 인스턴스 수명 동안 재사용
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=min(8, (os.cpu_count() or 4)), thread_name_prefix="io-copy"
+        )
+
     def convert(
         self,
         source_path: str,
@@ -88,6 +622,20 @@ class SpatialConverter:
             conversion_type=conversion_type.value
         )
 
+        # 변환 1건당 임시 작업 디렉토리 — 심볼릭 링크/중간 파일이 이 안에서
+        # 생성되고, 예외를 포함한 모든 경로에서 rmtree 한 번으로 정리됨
+        with tempfile.TemporaryDirectory(dir=str(self.temp_path)) as workdir:
+            options = {**options, "_workdir": Path(workdir)}
+            return self._dispatch_conversion(source, conversion_type, options, progress_callback)
+
+    def _dispatch_conversion(
+        self,
+        source: Path,
+        conversion_type: ConversionType,
+        options: dict,
+        progress_callback: Callable[[int], None] = None
+    ) -> ConversionResult:
+        """변환 타입별 메서드 디스패치 (convert의 작업 디렉토리 범위 내에서 실행)"""
         try:
             # 변환 타입에 따라 적절한 메서드 호출
             if conversion_type == ConversionType.E57_TO_PLY:
@@ -115,6 +663,492 @@ class SpatialConverter:
                 error=str(e)
             )
 
+    @classmethod
+    def warm_and_freeze(cls) -> None:
+        """무거운 의존성을 미리 import하고 GC 영구 세대로 동결
+
+        prefork 워커 환경에서 자식 프로세스의 GC/참조 카운트 쓰기가
+        부모에서 물려받은 페이지를 dirty로 만들어 copy-on-write 공유가
+        깨지는 것을 막습니다. 워커 fork 전에 한 번 호출하세요.
+        """
+        import gc
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            pass
+        try:
+            import laspy  # noqa: F401
+        except ImportError:
+            pass
+        gc.collect()
+        gc.freeze()
+        logger.info("converter_warmed_and_frozen")
+
+    async def convert_async(
+        self,
+        source_path: str,
+        conversion_type: ConversionType,
+        options: dict = None,
+        progress_callback: Callable[[int], None] = None
+    ) -> ConversionResult:
+        """비동기 컨텍스트용 변환 래퍼
+
+        변환은 subprocess/PDAL 대기가 대부분이므로 워커 스레드로
+        오프로드합니다. 내부의 독립 감지 단계는 이미 스레드 풀로 동시
+        실행되므로(asyncio.gather와 동일한 대기 중첩 효과), 이벤트 루프는
+        변환 중에도 다른 요청을 계속 처리할 수 있습니다.
+        """
+        import asyncio
+        return await asyncio.to_thread(
+            self.convert, source_path, conversion_type, options, progress_callback)
+
+    def convert_many(
+        self,
+        jobs: list,
+        max_workers: int = None
+    ) -> list:
+        """여러 변환 작업을 스레드 풀로 병렬 실행
+
+        각 변환은 대부분 subprocess 대기(GIL 해제 구간)이므로 스레드가
+        적합합니다 — PDAL/py3dtiles 프로세스들이 코어를 나눠 쓰며
+        배치 처리 시 코어 수에 비례해 처리량이 늘어납니다.
+
+        임시 심볼릭 링크는 uuid 접미사로 생성되고, 감지/메타데이터 캐시는
+        GIL 하의 dict 연산이므로 동시 실행에 안전합니다.
+
+        Args:
+            jobs: (source_path, conversion_type, options) 튜플 리스트
+                  (options 생략 가능)
+            max_workers: 동시 실행 수 (기본: CPU 코어 수, 최대 작업 수)
+
+        Returns:
+            입력 순서와 동일한 ConversionResult 리스트
+        """
+        if not jobs:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 4, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda job: self.convert(*job), jobs))
+
+    def _make_temp_symlink(
+        self, source: Path, prefix: str, ext: str, base_dir: Path = None
+    ) -> Path:
+        """확장자 없는 파일용 임시 심볼릭 링크 생성
+
+        uuid 접미사로 이름 충돌 자체를 제거하므로 exists()+unlink() 선행 검사
+        (검사와 생성 사이의 경쟁 구간)가 필요 없고, 동시 변환도 안전합니다.
+        base_dir로 변환별 작업 디렉토리를 지정하면 정리가 디렉토리 teardown에
+        맡겨집니다.
+        """
+        import uuid
+
+        base = base_dir or self.temp_path
+        link = base / f"{prefix}_{source.stem}_{uuid.uuid4().hex[:8]}.{ext}"
+        link.symlink_to(source)
+        return link
+
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path) -> None:
+        """데이터 블록을 건드리지 않는 가장 빠른 복사 경로 선택
+
+        1) os.link — 동일 파일시스템이면 O(1), 데이터 복사 없음
+        2) FICLONE ioctl — CoW 파일시스템(btrfs/XFS reflink)에서 O(1) 복제
+        3) os.copy_file_range — 커널 내 복사 (유저스페이스 버퍼 왕복 없음)
+        4) shutil.copyfile — 최종 fallback
+
+        dst가 이미 같은 inode면 재실행(재시도/재변환)에 대해 멱등 —
+        링크 실패 후 전체 재복사로 빠지지 않음
+        """
+        try:
+            if dst.exists() and os.path.samefile(src, dst):
+                return
+        except OSError:
+            pass
+
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+
+        try:
+            import fcntl
+            FICLONE = 0x40049409
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+        except (OSError, ImportError):
+            pass
+
+        # copy_file_range: 데이터가 커널 안에서만 이동 — 수 GB OBJ/텍스처에서
+        # Python 64K 버퍼 read/write 루프 대비 대역폭·CPU 모두 유리
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining == 0:
+                        return
+            except OSError:
+                pass
+
+        shutil.copyfile(src, dst)
+
+    @staticmethod
+    def _run_streaming_subprocess(cmd: list, timeout: int,
+                                  line_callback: Optional[Callable[[bytes], None]] = None) -> tuple:
+        """장시간 subprocess를 출력 상한을 두고 실행
+
+        subprocess.run(capture_output=True)은 프로세스 종료까지 stdout/stderr
+        전체를 메모리에 쌓음 — 1시간짜리 변환이 로그를 수 MB씩 쏟아내면
+        RSS가 계속 증가함. 출력을 비차단으로 흘려 받아 최근 라인만
+        bounded deque에 유지하므로 메모리 사용이 상수로 고정됨.
+
+        line_callback이 주어지면 완성된 라인마다 호출됨 — py3dtiles처럼
+        진행률을 출력하는 도구의 실시간 진행 보고에 사용.
+        CR 기반 진행 표시(\\r 갱신)도 라인으로 취급함.
+
+        Returns:
+            (returncode, 최근 출력 tail 문자열) 튜플
+
+        Raises:
+            subprocess.TimeoutExpired: 시간 초과 시 (프로세스는 kill됨)
+        """
+        tail = deque(maxlen=256)
+        pending = b""
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0
+        )
+
+        def _feed(data: bytes):
+            nonlocal pending
+            pending += data.replace(b"\r", b"\n")
+            *lines, pending = pending.split(b"\n")
+            tail.extend(lines)
+            if line_callback:
+                for line in lines:
+                    try:
+                        line_callback(line)
+                    except Exception:
+                        pass  # 진행률 파싱 실패가 변환을 중단시키지 않도록
+
+        def _drain():
+            # 프로세스 종료 후 파이프에 남은 출력(실패 메시지의 마지막
+            # 라인들)을 모두 비움 — 즉시 break하면 poll 직전에 쓰인
+            # 에러 tail이 유실됨. 종료 후라 블로킹 읽기도 즉시 EOF 도달
+            os.set_blocking(proc.stdout.fileno(), True)
+            while True:
+                data = proc.stdout.read(65536)
+                if not data:
+                    return
+                _feed(data)
+
+        os.set_blocking(proc.stdout.fileno(), False)
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                try:
+                    chunk = os.read(proc.stdout.fileno(), 65536)
+                except BlockingIOError:
+                    chunk = None
+
+                if chunk:
+                    _feed(chunk)
+                elif chunk == b"":
+                    # EOF — 프로세스 종료 대기 (남은 시간 내)
+                    try:
+                        proc.wait(timeout=max(deadline - time.monotonic(), 1))
+                    except subprocess.TimeoutExpired:
+                        # 대기 실패 시 자식을 남기지 않도록 kill 후 전파
+                        proc.kill()
+                        proc.wait()
+                        raise
+                    break
+                else:
+                    if proc.poll() is not None:
+                        _drain()
+                        break
+                    if time.monotonic() > deadline:
+                        proc.kill()
+                        proc.wait()
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+                    time.sleep(0.2)
+        finally:
+            proc.stdout.close()
+
+        if pending:
+            tail.append(pending)
+        output_tail = b"\n".join(tail).decode("utf-8", errors="replace")
+        return proc.returncode, output_tail
+
+    @staticmethod
+    def _file_cache_key(source: Path) -> Optional[tuple]:
+        """파일 내용 기반 캐시 키 생성: (경로, mtime_ns, size)
+
+        파일이 교체/수정되면 키가 달라져 stale 결과를 재사용하지 않음
+        """
+        try:
+            stat = source.stat()
+            return (str(source), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _extract_glb_bounds(glb_path: Path) -> Optional[dict]:
+        """GLB 헤더의 JSON 청크에서 POSITION accessor min/max를 직접 파싱
+
+        외부 도구나 전체 디코딩 없이 struct + json만으로 모델의
+        바운딩 박스와 정점 수를 얻습니다 (바이너리 청크는 읽지 않음).
+
+        Returns:
+            dict with keys min/max (각 [x, y, z]) / vertex_count, 실패 시 None
+        """
+        import struct
+
+        try:
+            with open(glb_path, 'rb') as f:
+                header = f.read(12)
+                if len(header) < 12:
+                    return None
+                magic, _version, _length = struct.unpack('<4sII', header)
+                if magic != b'glTF':
+                    return None
+
+                chunk_len, chunk_type = struct.unpack('<I4s', f.read(8))
+                if chunk_type != b'JSON':
+                    return None
+                gltf = _json_loads(f.read(chunk_len))
+
+            accessors = gltf.get("accessors", [])
+            mins = []
+            maxs = []
+            vertex_count = 0
+            for mesh in gltf.get("meshes", []):
+                for prim in mesh.get("primitives", []):
+                    idx = prim.get("attributes", {}).get("POSITION")
+                    if idx is None or idx >= len(accessors):
+                        continue
+                    acc = accessors[idx]
+                    if acc.get("min") and acc.get("max"):
+                        mins.append(acc["min"][:3])
+                        maxs.append(acc["max"][:3])
+                    vertex_count += acc.get("count", 0)
+
+            if not mins:
+                return None
+
+            return {
+                "min": [min(v[i] for v in mins) for i in range(3)],
+                "max": [max(v[i] for v in maxs) for i in range(3)],
+                "vertex_count": vertex_count
+            }
+        except Exception as e:
+            logger.warning("glb_bounds_extraction_failed",
+                          source=str(glb_path), error=str(e))
+            return None
+
+    def _pdal_quickinfo(self, source: Path, ext: str) -> Optional[dict]:
+        """PDAL 바인딩으로 헤더 수준 메타데이터 조회 (전체 포인트 읽기 없음)
+
+        reader의 preview()만 호출하므로 subprocess + JSON 재파싱 없이
+        bounds/num_points/dimensions를 네이티브 dict로 바로 얻습니다.
+
+        Returns:
+            reader 메타데이터 dict, 바인딩 미설치 또는 조회 실패 시 None
+        """
+        if pdal is None:
+            return None
+
+        try:
+            # type을 명시하면 확장자 없는 UUID 파일도 심볼릭 링크 없이 처리 가능
+            pipeline = pdal.Reader(str(source), type=f"readers.{ext}").pipeline()
+            quickinfo = pipeline.quickinfo
+            reader_info = quickinfo.get(f"readers.{ext}")
+            if reader_info is None and quickinfo:
+                reader_info = next(iter(quickinfo.values()))
+            return reader_info
+        except Exception as e:
+            logger.warning("pdal_quickinfo_failed", source=str(source), error=str(e))
+            return None
+
+    def _pdal_info(
+        self,
+        source: Path,
+        flag: str,
+        timeout: int = 120,
+        key_source: Path = None,
+        driver: str = None,
+    ) -> Optional[dict]:
+        """pdal info CLI 결과 메모이제이션 래퍼
+
+        좌표계·색상 감지가 한 변환 안에서 같은 소스를 반복 조회하므로,
+        (경로, mtime, size, flag) 키로 파싱된 JSON을 재사용해 fork/exec +
+        PDAL 기동 + JSON 파싱 비용을 건너뜁니다. 파일이 교체되면 키가
+        달라져 자동 무효화됩니다.
+
+        Args:
+            source: pdal에 넘길 실제 경로
+            flag: --summary / --metadata / --stats
+            key_source: 캐시 키로 쓸 원본 경로 (미지정 시 source)
+            driver: 확장자 없는 파일용 명시적 reader (예: "readers.e57")
+        """
+        cache_key = self._file_cache_key(key_source or source)
+        if cache_key:
+            cache_key = cache_key + (flag,)
+            cached = self._pdal_info_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        cmd = ["pdal", "info", flag]
+        if driver:
+            cmd.extend(["--driver", driver])
+        cmd.append(str(source))
+        info = self._run_pdal_json(cmd, timeout=timeout)
+        if info is None:
+            return None
+
+        if cache_key:
+            # 단순 용량 제한: 가장 오래된 항목부터 제거
+            if len(self._pdal_info_cache) >= 128:
+                self._pdal_info_cache.pop(next(iter(self._pdal_info_cache)))
+            self._pdal_info_cache[cache_key] = info
+        return info
+
+    @staticmethod
+    def _run_pdal_json(cmd: list, timeout: int = 120) -> Optional[dict]:
+        """PDAL CLI 실행 후 stdout JSON을 바이트에서 곧바로 파싱
+
+        capture_output=True + text=True는 전체 출력을 bytes로 모으고,
+        str로 디코드하고, 다시 파싱하는 세 벌의 복사본을 만듭니다.
+        --stats 출력은 수 MB까지 커질 수 있으므로 파이프에서 바이트를
+        한 번만 읽어 바로 파서에 넘겨 피크 메모리를 줄입니다.
+        """
+        try:
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            ) as proc:
+                try:
+                    data, err = proc.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    raise
+
+            if proc.returncode != 0:
+                logger.warning("pdal_json_failed",
+                              cmd=" ".join(cmd[:3]),
+                              returncode=proc.returncode,
+                              stderr=err[:500].decode("utf-8", errors="replace") if err else "")
+                return None
+
+            return _json_loads(data)
+        except Exception as e:
+            logger.warning("pdal_json_error", cmd=" ".join(cmd[:3]), error=str(e))
+            return None
+
+    def _classify_bounds(self, bounds: dict, num_points: int) -> dict:
+        """bounds/포인트 수로부터 좌표계 유형 분류 (휴리스틱)
+
+        Args:
+            bounds: minx/maxx/miny/maxy/minz/maxz 키를 갖는 dict
+            num_points: 포인트 수
+
+        Returns:
+            _detect_coordinate_system과 동일한 형식의 감지 결과 dict
+        """
+        import math
+
+        minx = bounds.get("minx", 0)
+        maxx = bounds.get("maxx", 0)
+        miny = bounds.get("miny", 0)
+        maxy = bounds.get("maxy", 0)
+        minz = bounds.get("minz", 0)
+        maxz = bounds.get("maxz", 0)
+
+        # 지리 좌표계 감지 휴리스틱:
+        # - X/Y 범위가 매우 작고 (< 1도)
+        # - Z 범위가 위도처럼 보이는 경우 (20-70도 범위)
+        # 또는 X/Y가 경위도 범위 내에 있는 경우
+        x_range = abs(maxx - minx)
+        y_range = abs(maxy - miny)
+        z_range = abs(maxz - minz)
+
+        # 유효성 검사: bounds가 0이거나 무한대면 좌표계 감지 불가
+        bounds_valid = (
+            x_range > 0.0001 and y_range > 0.0001 and  # 최소 범위
+            not math.isinf(z_range) and
+            not math.isinf(minx) and not math.isinf(maxx) and
+            not math.isinf(miny) and not math.isinf(maxy) and
+            not math.isinf(minz) and not math.isinf(maxz)
+        )
+
+        if not bounds_valid:
+            logger.warning("bounds_invalid_for_coordinate_detection",
+                          x_range=x_range, y_range=y_range, z_range=z_range)
+            flags = {name: False for name, _ in _COORD_RULES}
+        else:
+            metrics = {
+                "minx": minx, "miny": miny, "minz": minz,
+                "maxx": maxx, "maxy": maxy, "maxz": maxz,
+                "x_range": x_range, "y_range": y_range, "z_range": z_range,
+            }
+            flags = {name: rule(metrics) for name, rule in _COORD_RULES}
+
+        is_swapped_geo = flags["is_swapped"]
+        is_standard_geo = flags["is_standard_geo"]
+        is_korea_tm = flags["is_korea_tm"]
+        is_projected = flags["is_projected"]
+        is_geographic = is_swapped_geo or is_standard_geo
+
+        logger.info("coordinate_system_detected",
+                   is_geographic=is_geographic,
+                   is_swapped_geo=is_swapped_geo,
+                   is_korea_tm=is_korea_tm,
+                   is_projected=is_projected,
+                   x_range=x_range, y_range=y_range, z_range=z_range,
+                   bounds=bounds)
+
+        return {
+            "is_geographic": is_geographic,
+            "is_swapped": is_swapped_geo,
+            "is_korea_tm": is_korea_tm,
+            "is_projected": is_projected,
+            "point_count": num_points,
+            "bbox": (minx, miny, minz, maxx, maxy, maxz)
+        }
+
+    def _seed_coord_cache(self, file_path: Path, metadata: dict) -> None:
+        """변환 출력물의 summary 메타데이터로 좌표계 캐시를 선반영
+
+        파이프라인 실행 직후 이미 확보한 bounds를 재사용하여,
+        후속 단계에서 같은 파일을 PDAL로 다시 스캔하지 않도록 합니다.
+        """
+        try:
+            summary = metadata.get("summary", {})
+            bounds = summary.get("bounds")
+            if not bounds:
+                return
+
+            cache_key = self._file_cache_key(file_path)
+            if cache_key:
+                self._coord_cache[cache_key] = self._classify_bounds(
+                    bounds, summary.get("num_points", 0)
+                )
+                logger.info("coord_cache_seeded", source=str(file_path))
+        except Exception as e:
+            logger.warning("coord_cache_seed_failed", error=str(e))
+
     def _detect_coordinate_system(self, source: Path, file_format: str = None) -> dict:
         """좌표계 감지 (지리 좌표계 vs 투영 좌표계)
 
@@ -128,7 +1162,11 @@ class SpatialConverter:
             - point_count: number of points
             - bbox: bounding box (minx, miny, minz, maxx, maxy, maxz)
         """
-        temp_link = None
+        cache_key = self._file_cache_key(source)
+        if cache_key and cache_key in self._coord_cache:
+            logger.info("coordinate_cache_hit", source=str(source))
+            return dict(self._coord_cache[cache_key])
+
         try:
             # 파일 포맷 결정 (확장자 또는 명시적 지정)
             ext = source.suffix.lower().lstrip('.')
@@ -137,128 +1175,146 @@ class SpatialConverter:
             elif not ext:
                 ext = "e57"  # 기본값
 
-            # 확장자가 없는 파일의 경우 임시 심볼릭 링크 생성
-            if not source.suffix:
-                temp_link = self.temp_path / f"detect_{source.stem}.{ext}"
-                if temp_link.exists():
-                    temp_link.unlink()
-                temp_link.symlink_to(source)
-                info_source = temp_link
-                logger.info("created_temp_symlink", source=str(source), link=str(temp_link))
+            bounds = None
+            num_points = 0
+
+            # 1순위: PDAL 바인딩 quickinfo (in-process, subprocess 불필요)
+            quickinfo = self._pdal_quickinfo(source, ext)
+            if quickinfo is not None:
+                bounds = quickinfo.get("bounds", {})
+                num_points = quickinfo.get("num_points", 0)
             else:
-                info_source = source
+                # fallback: pdal info CLI (바인딩 미설치 환경)
+                # 확장자 없는 파일은 --driver로 reader를 명시 — 심볼릭 링크
+                # 생성/삭제 syscall과 동시 실행 시 경합 여지를 제거
+                driver = f"readers.{ext}" if not source.suffix else None
+                info = self._pdal_info(source, "--summary", driver=driver)
+                if info is not None:
+                    summary = info.get("summary", {})
+                    bounds = summary.get("bounds", {})
+                    num_points = summary.get("num_points", 0)
+
+            if bounds is not None:
+                detection = self._classify_bounds(bounds, num_points)
+
+                # 성공한 감지 결과만 캐시 (실패 기본값은 재시도 여지를 남김)
+                if cache_key:
+                    if len(self._coord_cache) >= 256:
+                        self._coord_cache.pop(next(iter(self._coord_cache)))
+                    self._coord_cache[cache_key] = dict(detection)
+
+                return detection
+        except Exception as e:
+            logger.warning("coordinate_detection_failed", error=str(e))
+
+        return {"is_geographic": False, "point_count": 0, "bbox": None}
+
+    @staticmethod
+    def _find_statistic(meta):
+        """메타데이터 트리에서 filters.stats의 statistic 리스트 탐색
+
+        pdal pipeline --metadata 출력은 버전에 따라 스테이지 키 구조가
+        달라 재귀 탐색으로 방어적으로 찾습니다.
+        """
+        if isinstance(meta, dict):
+            if isinstance(meta.get("statistic"), list):
+                return meta["statistic"]
+            for value in meta.values():
+                found = SpatialConverter._find_statistic(value)
+                if found:
+                    return found
+        elif isinstance(meta, list):
+            for item in meta:
+                found = SpatialConverter._find_statistic(item)
+                if found:
+                    return found
+        return None
+
+    def _probe_color_stats(self, source: Path, ext: str) -> Optional[list]:
+        """RGB 통계를 단일 파이프라인 실행으로 조회
+
+        pdal info --stats는 별도 프로세스로 전 차원을 집계 — 여기서는
+        reader → filters.stats(RGB 한정) → writers.null 파이프라인 한 번으로
+        필요한 최댓값만 얻습니다 (프로세스 1회, 스캔 1회, 집계 차원 3개).
+
+        Returns:
+            filters.stats의 statistic 리스트, 실패 시 None
+        """
+        pipeline = {
+            "pipeline": [
+                {"type": f"readers.{ext}", "filename": str(source)},
+                {"type": "filters.stats", "dimensions": "Red,Green,Blue"},
+                {"type": "writers.null"},
+            ]
+        }
+
+        # 1순위: PDAL 바인딩으로 in-process 실행 — fork/exec와 PDAL 기동
+        # (~수백 ms), 임시 메타데이터 파일까지 모두 생략
+        if pdal is not None:
+            try:
+                pl = pdal.Pipeline(json.dumps(pipeline))
+                # reader→stats→null은 스트리밍 가능 — execute()는 전체
+                # 포인트를 메모리에 적재하므로 청크 단위 실행으로 RSS 고정
+                if pl.streamable:
+                    pl.execute_streaming(chunk_size=PDAL_STREAM_CHUNK_SIZE)
+                else:
+                    pl.execute()
+                meta = pl.metadata
+                if isinstance(meta, (str, bytes)):
+                    meta = _json_loads(meta)
+                stats = self._find_statistic(meta)
+                if stats:
+                    return stats
+            except Exception as e:
+                logger.warning("color_stats_inprocess_failed", error=str(e))
 
+        meta_file = None
+        try:
+            fd, meta_file = tempfile.mkstemp(suffix=".json", dir=str(self.temp_path))
+            os.close(fd)
             result = subprocess.run(
-                ["pdal", "info", "--summary", str(info_source)],
+                ["pdal", "pipeline", "--stdin", "--metadata", meta_file],
+                input=json.dumps(pipeline),
                 capture_output=True,
                 text=True,
-                timeout=120
+                timeout=180
             )
-
-            if result.returncode == 0:
-                info = json.loads(result.stdout)
-                summary = info.get("summary", {})
-                bounds = summary.get("bounds", {})
-
-                minx = bounds.get("minx", 0)
-                maxx = bounds.get("maxx", 0)
-                miny = bounds.get("miny", 0)
-                maxy = bounds.get("maxy", 0)
-                minz = bounds.get("minz", 0)
-                maxz = bounds.get("maxz", 0)
-
-                # 지리 좌표계 감지 휴리스틱:
-                # - X/Y 범위가 매우 작고 (< 1도)
-                # - Z 범위가 위도처럼 보이는 경우 (20-70도 범위)
-                # 또는 X/Y가 경위도 범위 내에 있는 경우
-                x_range = abs(maxx - minx)
-                y_range = abs(maxy - miny)
-                z_range = abs(maxz - minz)
-
-                # 유효성 검사: bounds가 0이거나 무한대면 좌표계 감지 불가
-                import math
-                bounds_valid = (
-                    x_range > 0.0001 and y_range > 0.0001 and  # 최소 범위
-                    not math.isinf(z_range) and
-                    not math.isinf(minx) and not math.isinf(maxx) and
-                    not math.isinf(miny) and not math.isinf(maxy) and
-                    not math.isinf(minz) and not math.isinf(maxz)
-                )
-
-                if not bounds_valid:
-                    logger.warning("bounds_invalid_for_coordinate_detection",
-                                  x_range=x_range, y_range=y_range, z_range=z_range)
-                    is_swapped_geo = False
-                    is_standard_geo = False
-                    is_korea_tm = False
-                    is_projected = False
-                else:
-                    # 패턴 1: X/Y가 매우 작고 Z가 위도 범위 (좌표 축 뒤바뀜)
-                    is_swapped_geo = (x_range < 1 and y_range < 1 and
-                                      20 <= minz <= 70 and 20 <= maxz <= 70)
-
-                    # 패턴 2: 표준 지리 좌표 (-180~180, -90~90)
-                    is_standard_geo = (-180 <= minx <= 180 and -180 <= maxx <= 180 and
-                                       -90 <= miny <= 90 and -90 <= maxy <= 90 and
-                                       x_range < 10 and y_range < 10)  # 10도 이내 범위
-
-                    # 패턴 3: 한국 TM 좌표계 (EPSG:5186, 5187 등)
-                    # X: 약 100,000 ~ 600,000 (동서 방향, km 단위 × 1000)
-                    # Y: 약 100,000 ~ 700,000 (남북 방향)
-                    is_korea_tm = (100000 <= minx <= 700000 and 100000 <= maxx <= 700000 and
-                                   100000 <= miny <= 700000 and 100000 <= maxy <= 700000 and
-                                   z_range < 1000)  # 높이 1km 이내
-
-                    # 패턴 4: UTM 좌표계 (미터 단위)
-                    # X: 100,000 ~ 900,000
-                    # Y: 0 ~ 10,000,000
-                    is_projected = (10000 <= abs(minx) <= 10000000 and
-                                   10000 <= abs(miny) <= 10000000 and
-                                   z_range < 5000)  # 높이 5km 이내
-
-                is_geographic = is_swapped_geo or is_standard_geo
-
-                logger.info("coordinate_system_detected",
-                           is_geographic=is_geographic,
-                           is_swapped_geo=is_swapped_geo,
-                           is_korea_tm=is_korea_tm,
-                           is_projected=is_projected,
-                           x_range=x_range, y_range=y_range, z_range=z_range,
-                           bounds=bounds)
-
-                return {
-                    "is_geographic": is_geographic,
-                    "is_swapped": is_swapped_geo,
-                    "is_korea_tm": is_korea_tm,
-                    "is_projected": is_projected,
-                    "point_count": summary.get("num_points", 0),
-                    "bbox": (minx, miny, minz, maxx, maxy, maxz)
-                }
-            else:
-                logger.warning("coordinate_detection_pdal_failed",
+            if result.returncode != 0:
+                logger.warning("color_stats_probe_failed",
                               returncode=result.returncode,
-                              stderr=result.stderr[:500] if result.stderr else "")
+                              stderr=result.stderr[:300] if result.stderr else "")
+                return None
+
+            with open(meta_file, 'rb') as fh:
+                meta = _json_loads(fh.read())
+            return self._find_statistic(meta)
         except Exception as e:
-            logger.warning("coordinate_detection_failed", error=str(e))
+            logger.warning("color_stats_probe_error", error=str(e))
+            return None
         finally:
-            # 임시 심볼릭 링크 정리
-            if temp_link and temp_link.exists():
+            if meta_file:
                 try:
-                    temp_link.unlink()
-                except Exception:
+                    os.unlink(meta_file)
+                except OSError:
                     pass
 
-        return {"is_geographic": False, "point_count": 0, "bbox": None}
-
     def _detect_color_info(self, source: Path, file_format: str = None) -> dict:
         """색상 데이터 정보 감지
 
+        스키마(RGB 차원 존재)는 quickinfo 헤더 조회로, 16비트 판별은
+        RGB 한정 filters.stats 파이프라인 1회로 확인 — 기존의
+        metadata + stats 2회 전체 스캔을 융합한 경로입니다.
+
         Returns:
             dict with keys:
             - has_color: True if RGB dimensions exist
             - is_16bit: True if color values appear to be 16-bit (> 255)
         """
-        temp_link = None
+        cache_key = self._file_cache_key(source)
+        if cache_key and cache_key in self._color_cache:
+            logger.info("color_cache_hit", source=str(source))
+            return dict(self._color_cache[cache_key])
+
         try:
             ext = source.suffix.lower().lstrip('.')
             if not ext and file_format:
@@ -266,79 +1322,89 @@ class SpatialConverter:
             elif not ext:
                 ext = "e57"
 
-            if not source.suffix:
-                temp_link = self.temp_path / f"color_{source.stem}.{ext}"
-                if temp_link.exists():
-                    temp_link.unlink()
-                temp_link.symlink_to(source)
-                info_source = temp_link
-            else:
-                info_source = source
-
-            # 차원 정보 조회
-            result = subprocess.run(
-                ["pdal", "info", "--metadata", str(info_source)],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-
-            if result.returncode == 0:
-                info = json.loads(result.stdout)
+            # 1순위: quickinfo 헤더 조회로 차원 목록 확인 (스캔 없음)
+            dims = None
+            quickinfo = self._pdal_quickinfo(source, ext)
+            if quickinfo is not None:
+                raw_dims = quickinfo.get("dimensions", "")
+                if isinstance(raw_dims, str):
+                    dims = [d.strip() for d in raw_dims.split(",") if d.strip()]
+                else:
+                    dims = list(raw_dims)
+
+            if dims is None:
+                # fallback: pdal info --metadata (바인딩 미설치 환경)
+                # 확장자 없는 파일은 --driver로 reader를 명시 (심볼릭 링크 불필요)
+                driver = f"readers.{ext}" if not source.suffix else None
+                info = self._pdal_info(source, "--metadata", driver=driver)
+                if info is None:
+                    return {"has_color": False, "is_16bit": False}
                 metadata = info.get("metadata", {})
-
-                # 차원 목록에서 RGB 확인
-                dims = []
                 if "dimensions" in metadata:
                     dims = metadata["dimensions"]
-                elif "schema" in metadata:
+                else:
                     dims = [d.get("name", "") for d in metadata.get("schema", {}).get("dimensions", [])]
 
-                has_red = any("red" in str(d).lower() for d in dims)
-                has_green = any("green" in str(d).lower() for d in dims)
-                has_blue = any("blue" in str(d).lower() for d in dims)
-                has_color = has_red and has_green and has_blue
-
-                # 통계 정보로 16비트 여부 확인
-                is_16bit = False
-                if has_color:
-                    stats_result = subprocess.run(
-                        ["pdal", "info", "--stats", str(info_source)],
-                        capture_output=True,
-                        text=True,
-                        timeout=180
-                    )
-                    if stats_result.returncode == 0:
-                        stats_info = json.loads(stats_result.stdout)
-                        stats = stats_info.get("statistics", {}).get("statistic", [])
-                        for stat in stats:
-                            name = stat.get("name", "").lower()
-                            if name in ["red", "green", "blue"]:
-                                max_val = stat.get("maximum", 0)
-                                if max_val > 255:
-                                    is_16bit = True
-                                    break
-
-                logger.info("color_info_detected",
-                           has_color=has_color,
-                           is_16bit=is_16bit,
-                           dims=dims[:10] if dims else [])
+            has_red = any("red" in str(d).lower() for d in dims)
+            has_green = any("green" in str(d).lower() for d in dims)
+            has_blue = any("blue" in str(d).lower() for d in dims)
+            has_color = has_red and has_green and has_blue
+
+            # 통계 정보로 16비트 여부 확인 (색상이 있을 때만 스캔)
+            # RGB 한정 filters.stats 프로브 단일 패스가 유일한 스캔 경로 —
+            # 전 차원을 집계하던 pdal info --stats 재실행은 제거
+            is_16bit = False
+            stats = None
+            if has_color:
+                stats = self._probe_color_stats(source, ext)
+                for stat in stats or []:
+                    name = stat.get("name", "").lower()
+                    if name in ["red", "green", "blue"]:
+                        max_val = stat.get("maximum", 0)
+                        if max_val > 255:
+                            is_16bit = True
+                            break
 
-                return {"has_color": has_color, "is_16bit": is_16bit}
-            else:
-                logger.warning("color_detection_pdal_failed", stderr=result.stderr[:200] if result.stderr else "")
+            logger.info("color_info_detected",
+                       has_color=has_color,
+                       is_16bit=is_16bit,
+                       dims=dims[:10] if dims else [])
+
+            result = {"has_color": has_color, "is_16bit": is_16bit}
+            # 스키마 확인까지 끝난 결과는 부정(무색)이어도 캐시 —
+            # 예외/프로브 실패 기본값은 캐시하지 않아 재시도 여지를 남김.
+            # 유색인데 stats 프로브가 실패(None)한 경우도 캐시 제외:
+            # is_16bit=False 기본값이 굳으면 16비트 색이 스케일 없이 기록됨
+            if cache_key and (not has_color or stats is not None):
+                if len(self._color_cache) >= 256:
+                    self._color_cache.pop(next(iter(self._color_cache)))
+                self._color_cache[cache_key] = dict(result)
+            return result
         except Exception as e:
             logger.warning("color_detection_failed", error=str(e))
-        finally:
-            if temp_link and temp_link.exists():
-                try:
-                    temp_link.unlink()
-                except Exception:
-                    pass
 
         return {"has_color": False, "is_16bit": False}
 
     def _extract_obj_spatial_info(self, source: Path) -> dict:
+        """OBJ 공간 정보 추출 — 파일 키 캐시 래퍼
+
+        같은 소스를 다시 변환(재시도, 다른 출력 포맷)할 때 수백만 정점
+        AABB 스캔이 반복되지 않도록 (경로, mtime, size) 키로 결과를 캐시
+        """
+        cache_key = self._file_cache_key(source)
+        if cache_key and cache_key in self._obj_spatial_cache:
+            logger.info("obj_spatial_cache_hit", source=str(source))
+            return dict(self._obj_spatial_cache[cache_key])
+
+        result = self._scan_obj_spatial_info(source)
+
+        if cache_key and result.get("bbox"):
+            if len(self._obj_spatial_cache) >= 128:
+                self._obj_spatial_cache.pop(next(iter(self._obj_spatial_cache)))
+            self._obj_spatial_cache[cache_key] = dict(result)
+        return result
+
+    def _scan_obj_spatial_info(self, source: Path) -> dict:
         """OBJ 파일에서 공간 정보(좌표 범위) 추출
 
         OBJ 파일의 정점(vertex) 좌표를 파싱하여:
@@ -361,26 +1427,59 @@ class SpatialConverter:
         vertex_count = 0
 
         try:
-            with open(source, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('v '):
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            try:
-                                x = float(parts[1])
-                                y = float(parts[2])
-                                z = float(parts[3])
-
-                                minx = min(minx, x)
-                                miny = min(miny, y)
-                                minz = min(minz, z)
-                                maxx = max(maxx, x)
-                                maxy = max(maxy, y)
-                                maxz = max(maxz, z)
-                                vertex_count += 1
-                            except ValueError:
-                                continue
+            # 1순위: NumPy 벌크 파싱 — 정점 라인을 정규식으로 한 번에 배열화하고
+            # min/max를 C 레벨 reduction으로 계산 (라인당 인터프리터 왕복 제거)
+            try:
+                import numpy as np
+                data = np.fromregex(
+                    str(source),
+                    _OBJ_V_XYZ_RE,
+                    dtype=[('x', 'f8'), ('y', 'f8'), ('z', 'f8')]
+                )
+                vertex_count = int(data.shape[0])
+                if vertex_count > 0:
+                    minx = float(data['x'].min())
+                    miny = float(data['y'].min())
+                    minz = float(data['z'].min())
+                    maxx = float(data['x'].max())
+                    maxy = float(data['y'].max())
+                    maxz = float(data['z'].max())
+            except Exception as e:
+                logger.warning("obj_numpy_scan_failed", error=str(e))
+                vertex_count = 0
+
+            if vertex_count == 0:
+                # fallback: mmap 바이트 스캔 (NumPy 실패/비정형 파일)
+                # 텍스트 모드의 라인 버퍼링/유니코드 디코드 없이 C 레벨
+                # readline으로 순회, float()는 바이트를 직접 받음
+                import mmap
+                with open(source, 'rb') as fh:
+                    try:
+                        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (ValueError, OSError):
+                        mm = fh  # 빈 파일 등 mmap 불가 시 파일 객체 그대로
+
+                    for line in iter(mm.readline, b''):
+                        if line[:2] == b'v ' or line[:2] == b'v\t':
+                            parts = line.split()
+                            if len(parts) >= 4:
+                                try:
+                                    x = float(parts[1])
+                                    y = float(parts[2])
+                                    z = float(parts[3])
+
+                                    minx = min(minx, x)
+                                    miny = min(miny, y)
+                                    minz = min(minz, z)
+                                    maxx = max(maxx, x)
+                                    maxy = max(maxy, y)
+                                    maxz = max(maxz, z)
+                                    vertex_count += 1
+                                except ValueError:
+                                    continue
+
+                    if mm is not fh:
+                        mm.close()
 
             if vertex_count == 0:
                 logger.warning("obj_no_vertices", source=str(source))
@@ -528,21 +1627,87 @@ class SpatialConverter:
                    meters_per_deg_lon=f"{meters_per_deg_lon:.2f}",
                    meters_per_deg_lat=f"{meters_per_deg_lat:.2f}")
 
+        try:
+            # mmap + NumPy 벡터 변환 경로: 정점 토큰을 정규식으로 일괄 추출해
+            # (N,3) 배열로 만들고, 아핀 변환을 단일 벡터 연산으로 적용.
+            # 비정점 구간은 mmap 슬라이스로 그대로 통과 — 라인 리스트를
+            # 메모리에 쌓지 않음
+            import mmap
+            import numpy as np
+
+            with open(source, 'rb') as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    matches = list(_OBJ_V_LINE_RE.finditer(mm))
+                    if not matches:
+                        raise ValueError("no vertex lines matched")
+
+                    coords = np.asarray(
+                        [m.group(1, 2, 3) for m in matches], dtype='S32'
+                    ).astype(np.float64)
+                    if _wgs84_to_local_kernel is not None:
+                        # Numba JIT 커널 — 대형 메쉬에서 멀티코어 스케일링
+                        _wgs84_to_local_kernel(
+                            coords, center_lon, center_lat,
+                            meters_per_deg_lon, meters_per_deg_lat)
+                    else:
+                        coords[:, 0] = (coords[:, 0] - center_lon) * meters_per_deg_lon
+                        coords[:, 1] = (coords[:, 1] - center_lat) * meters_per_deg_lat
+                    # Z는 이미 미터 단위 — 그대로 유지
+
+                    # 세그먼트를 bytearray에 모아 큰 단위로만 write() 호출
+                    # (라인당 write 호출/인코더 왕복 제거, 64MB 상한으로 flush)
+                    with open(output, 'wb') as out:
+                        buf = bytearray()
+                        pos = 0
+                        for m, row in zip(matches, coords):
+                            buf += mm[pos:m.start()]
+                            buf += f"v {row[0]:.6f} {row[1]:.6f} {row[2]:.6f}".encode('ascii')
+                            tail = m.group(4)
+                            if tail:
+                                buf += tail
+                            pos = m.end()
+                            if len(buf) >= (1 << 26):
+                                out.write(buf)
+                                buf.clear()
+                        buf += mm[pos:]
+                        out.write(buf)
+                finally:
+                    mm.close()
+
+            vertex_count = len(matches)
+            logger.info("obj_wgs84_transform_complete",
+                       vertex_count=vertex_count,
+                       output=str(output),
+                       vectorized=True)
+
+            return True, {
+                'center_lon': center_lon,
+                'center_lat': center_lat,
+                'meters_per_deg_lon': meters_per_deg_lon,
+                'meters_per_deg_lat': meters_per_deg_lat,
+                'vertex_count': vertex_count
+            }
+        except Exception as e:
+            logger.warning("obj_numpy_transform_failed", error=str(e))
+
+        # fallback: 순수 Python 라인 변환 (NumPy 실패/비정형 파일)
+        # 바이너리 모드 — 라인 전체를 UTF-8 디코드하지 않고 좌표 토큰
+        # 3개만 ASCII 디코드 (프리픽스 비교는 bytes.startswith)
         try:
             transformed_lines = []
             vertex_count = 0
 
-            with open(source, 'r', encoding='utf-8', errors='ignore') as f:
+            with open(source, 'rb') as f:
                 for line in f:
-                    stripped = line.strip()
-                    if stripped.startswith('v '):
-                        parts = stripped.split()
+                    if line.startswith((b'v ', b'v\t')):
+                        parts = line.split()
                         if len(parts) >= 4:
                             try:
                                 # OBJ: X=경도, Y=위도, Z=높이
-                                lon = float(parts[1])
-                                lat = float(parts[2])
-                                z = float(parts[3])
+                                lon = float(parts[1].decode('ascii', 'ignore'))
+                                lat = float(parts[2].decode('ascii', 'ignore'))
+                                z = float(parts[3].decode('ascii', 'ignore'))
 
                                 # 중심점 기준 로컬 미터 좌표로 변환
                                 local_x = (lon - center_lon) * meters_per_deg_lon
@@ -550,11 +1715,11 @@ class SpatialConverter:
                                 local_z = z  # 이미 미터 단위
 
                                 # 변환된 정점 라인 생성
-                                new_line = f"v {local_x:.6f} {local_y:.6f} {local_z:.6f}"
+                                new_line = b"v %.6f %.6f %.6f" % (local_x, local_y, local_z)
                                 if len(parts) > 4:
                                     # 추가 데이터 (색상 등) 보존
-                                    new_line += ' ' + ' '.join(parts[4:])
-                                transformed_lines.append(new_line + '\n')
+                                    new_line += b' ' + b' '.join(parts[4:])
+                                transformed_lines.append(new_line + b'\n')
                                 vertex_count += 1
                             except ValueError:
                                 transformed_lines.append(line)
@@ -563,9 +1728,9 @@ class SpatialConverter:
                     else:
                         transformed_lines.append(line)
 
-            # 변환된 OBJ 파일 저장
-            with open(output, 'w', encoding='utf-8') as f:
-                f.writelines(transformed_lines)
+            # 변환된 OBJ 파일 저장 — 단일 write로 기록
+            with open(output, 'wb') as f:
+                f.write(b''.join(transformed_lines))
 
             logger.info("obj_wgs84_transform_complete",
                        vertex_count=vertex_count,
@@ -583,63 +1748,25 @@ class SpatialConverter:
             logger.error("obj_wgs84_transform_failed", error=str(e))
             return False, {}
 
-    def _convert_e57_to_ply(
-        self,
-        source: Path,
-        options: dict,
-        progress_callback: Callable[[int], None] = None
-    ) -> ConversionResult:
-        """E57 → PLY 변환 (PDAL 사용, 웹 뷰어용 다운샘플링 포함)"""
-        output_name = source.stem + ".ply"
-        output_path = self.output_base / output_name
-
-        # 좌표계 감지 (E57 파일 포맷 명시)
-        coord_info = self._detect_coordinate_system(source, file_format="e57")
-        is_geographic = coord_info.get("is_geographic", False)
-        is_swapped_geo = coord_info.get("is_swapped", False)  # X/Y가 작고 Z가 위도인 경우
-        is_korea_tm = coord_info.get("is_korea_tm", False)
-        is_projected = coord_info.get("is_projected", False)
-        point_count = coord_info.get("point_count", 0)
-
-        # bounds 유효성 검사 (Infinity, NaN 체크)
-        bbox = coord_info.get("bbox")
-        has_valid_bounds = False
-        if bbox:
-            import math
-            has_valid_bounds = all(
-                not math.isinf(v) and not math.isnan(v)
-                for v in bbox
-            )
-            if not has_valid_bounds:
-                logger.warning("invalid_bounds_detected", bbox=bbox)
-                bbox = None
-
-        # 색상 정보 감지
-        color_info = self._detect_color_info(source, file_format="e57")
-        has_color = color_info.get("has_color", False)
-        is_16bit_color = color_info.get("is_16bit", False)
+    def _build_e57_pipeline_stages(self, ctx: "_PipelineContext") -> list:
+        """입력 형상 요약(ctx)으로부터 E57 변환 파이프라인 stage 리스트 생성
 
-        # 복셀 크기 결정
-        if is_geographic:
-            # 지리 좌표계: 도(degree) 단위이므로 훨씬 작은 값 사용
-            # 0.00001도 ≈ 약 1.1m (적도 기준)
-            voxel_size = options.get("voxel_size", 0.00001)
-            logger.info("using_geographic_voxel_size", voxel_size=voxel_size)
-        elif is_korea_tm or is_projected:
-            # 한국 TM 또는 UTM 좌표계: 미터 단위
-            # 0.05m = 5cm 간격
-            voxel_size = options.get("voxel_size", 0.05)
-            logger.info("using_projected_voxel_size", voxel_size=voxel_size, is_korea_tm=is_korea_tm)
-        else:
-            # 기타 좌표계: 미터 단위 가정
-            # 0.05m = 5cm 간격
-            voxel_size = options.get("voxel_size", 0.05)
-
-        # 좌표계 변환 여부 (Z-up → Y-up)
-        # 프론트엔드 PLY 로더에서 별도 회전을 적용하지 않으므로,
-        # 한국 TM / 투영 좌표계(명확히 Z-up)만 변환, 나머지는 원본 유지
-        # (E57 스캐너 데이터는 이미 Y-up이거나 방향이 다양하여 일괄 변환 시 눕혀짐)
-        transform_coords = options.get("transform_coords", is_korea_tm or is_projected)
+        다운샘플링 전략, 정규화/축 변환 행렬, 색상 처리, writer 선택까지
+        모든 분기가 이 빌더 안에서 결정됩니다.
+        """
+        source = ctx.source
+        output_path = ctx.output_path
+        output_format = ctx.output_format
+        voxel_size = ctx.voxel_size
+        point_count = ctx.point_count
+        bbox = ctx.bbox
+        has_valid_bounds = ctx.has_valid_bounds
+        is_geographic = ctx.is_geographic
+        is_korea_tm = ctx.is_korea_tm
+        is_projected = ctx.is_projected
+        has_color = ctx.has_color
+        is_16bit_color = ctx.is_16bit_color
+        transform_coords = ctx.transform_coords
 
         # PDAL 파이프라인 구성
         pipeline_stages = [
@@ -649,23 +1776,50 @@ class SpatialConverter:
             }
         ]
 
-        # 다운샘플링: 지리 좌표계는 decimation, 투영 좌표계는 복셀 다운샘플링
+        # 다운샘플링: 복셀 다운샘플링 우선 (공간적으로 균일한 밀도 유지)
         if is_geographic and point_count > 500000:
-            # 지리 좌표계: decimation으로 50만 포인트로 제한
-            # (voxel은 도(degree) 단위에서 제대로 작동하지 않음)
-            step = max(1, int(point_count / 500000))
-            pipeline_stages.append({
-                "type": "filters.decimation",
-                "step": step
-            })
-            logger.info("using_decimation_sampling",
-                       original_count=point_count,
-                       target_count=500000,
-                       step=step)
+            if has_valid_bounds and bbox:
+                # 지리 좌표계: 도(degree) 단위 복셀로 다운샘플링
+                # voxel_size는 위에서 도 단위로 선택됨 (0.00001도 ≈ 1.1m).
+                # 국소 영역에서는 도↔미터 환산이 상수에 가까우므로
+                # 로컬 메트릭 투영 후 복셀링과 동일한 효과 — decimation처럼
+                # 밀집 구역만 과도하게 남기지 않음
+                pipeline_stages.append({
+                    "type": "filters.voxeldownsize",
+                    "cell": voxel_size,
+                    "mode": "center"
+                })
+                logger.info("using_geographic_voxel_downsampling",
+                           voxel_size=voxel_size,
+                           original_count=point_count)
+            else:
+                # bounds를 모르면 복셀 크기 판단 근거가 없음 → decimation fallback
+                step = max(1, int(point_count / 500000))
+                pipeline_stages.append({
+                    "type": "filters.decimation",
+                    "step": step
+                })
+                logger.info("using_decimation_sampling",
+                           original_count=point_count,
+                           target_count=500000,
+                           step=step)
         elif is_geographic:
             # 지리 좌표계지만 포인트 수가 적으면 다운샘플링 생략
             logger.info("skipping_downsampling", reason="geographic_small_pointcount", point_count=point_count)
         elif is_korea_tm or is_projected:
+            # 초대용량 클라우드는 복셀 단계 전에 거친 decimation으로 1차 축소
+            # (복셀 점유 해시가 원본 포인트 수에 비례해 커지는 것을 방지 —
+            #  계층적으로 좁혀가는 2단계 다운샘플링)
+            if point_count > 20_000_000:
+                pre_step = max(1, int(point_count / 20_000_000))
+                pipeline_stages.append({
+                    "type": "filters.decimation",
+                    "step": pre_step
+                })
+                logger.info("using_coarse_pre_decimation",
+                           original_count=point_count,
+                           pre_step=pre_step)
+
             # 한국 TM / 투영 좌표계: 복셀 그리드 다운샘플링
             pipeline_stages.append({
                 "type": "filters.voxeldownsize",
@@ -725,12 +1879,29 @@ class SpatialConverter:
                 # filters.transformation 사용 - 중심 이동 후 스케일링
                 # 4x4 변환 행렬: [scale_x, 0, 0, -cx*scale_x, 0, scale_y, 0, -cy*scale_y, 0, 0, scale_z, -cz*scale_z, 0, 0, 0, 1]
                 # 행렬 형식: row-major (행 우선)
-                transform_matrix = (
-                    f"{scale_x} 0 0 {-cx * scale_x} "
-                    f"0 {scale_y} 0 {-cy * scale_y} "
-                    f"0 0 {scale_z} {-cz * scale_z} "
-                    f"0 0 0 1"
-                )
+                tx = -cx * scale_x
+                ty = -cy * scale_y
+                tz = -cz * scale_z
+
+                if transform_coords:
+                    # Z-up→Y-up 회전을 정규화 행렬에 미리 곱해 결합
+                    # (YUP @ NORM — filters.transformation 1회 = 버퍼 1회 순회)
+                    transform_matrix = (
+                        f"{scale_x} 0 0 {tx} "
+                        f"0 0 {scale_z} {tz} "
+                        f"0 {-scale_y} 0 {-ty} "
+                        f"0 0 0 1"
+                    )
+                    axis_transform_fused = True
+                else:
+                    transform_matrix = (
+                        f"{scale_x} 0 0 {tx} "
+                        f"0 {scale_y} 0 {ty} "
+                        f"0 0 {scale_z} {tz} "
+                        f"0 0 0 1"
+                    )
+                    axis_transform_fused = False
+
                 pipeline_stages.append({
                     "type": "filters.transformation",
                     "matrix": transform_matrix
@@ -739,29 +1910,34 @@ class SpatialConverter:
         elif not has_valid_bounds:
                 logger.warning("skipping_normalization", reason="invalid_bounds")
 
+        if not normalization_applied:
+            axis_transform_fused = False
+
         # Z-up → Y-up 좌표계 변환 (Three.js는 Y-up 사용)
-        # 변환 행렬: X'=X, Y'=Z, Z'=-Y (X축 기준 -90도 회전)
-        if transform_coords:
+        # 정규화 행렬에 결합되지 않은 경우에만 별도 stage로 적용
+        if transform_coords and not axis_transform_fused:
             pipeline_stages.append({
                 "type": "filters.transformation",
-                "matrix": "1 0 0 0  0 0 1 0  0 -1 0 0  0 0 0 1"
+                "matrix": ZUP_TO_YUP_MATRIX
             })
 
         # 색상 처리 및 출력 dims 결정
+        # filters.assign은 stage마다 포인트 버퍼를 한 번씩 순회하므로,
+        # 모든 할당식을 하나의 리스트에 모아 단일 stage로 융합 (버퍼 1회 순회).
+        # 불변 조건: 아래 분기들은 assign_values에 추가만 하고 stage를 직접
+        # append하지 않는다 — RGB 쓰기가 두 번째 per-point 패스를 만들지 않도록
         output_has_color = False
+        assign_values = []
 
         if has_color:
             if is_16bit_color:
                 # 16비트 색상 → 8비트 스케일링
                 logger.info("applying_color_scaling", reason="16bit_to_8bit")
-                pipeline_stages.append({
-                    "type": "filters.assign",
-                    "value": [
-                        "Red = Red / 256",
-                        "Green = Green / 256",
-                        "Blue = Blue / 256"
-                    ]
-                })
+                assign_values.extend([
+                    "Red = Red / 256",
+                    "Green = Green / 256",
+                    "Blue = Blue / 256"
+                ])
             else:
                 # 이미 8비트 색상 - 스케일링 불필요
                 logger.info("skipping_color_scaling", reason="already_8bit")
@@ -773,39 +1949,146 @@ class SpatialConverter:
             # Z 값을 0-255 범위로 매핑하여 색상 생성
             # 정규화 후 Z 범위는 대략 -50 ~ 50
             # Red: 높을수록 강함, Blue: 낮을수록 강함
+            assign_values.extend([
+                "Red = (Z + 50) * 2 + 55",
+                "Green = 180",
+                "Blue = (50 - Z) * 2 + 55"
+            ])
+            output_has_color = True
+        elif ctx.force_default_color:
+            # 색상 없음 + 정규화 안됨 - 옵션으로 요청된 경우에만 단색을 베이크
+            logger.info("generating_fallback_color", reason="force_default_color")
+            # filters.assign으로 직접 RGB 값 생성
+            assign_values.extend([
+                "Red = 150",
+                "Green = 180",
+                "Blue = 210"
+            ])
+            output_has_color = True
+        else:
+            # 색상 없음 - RGB 차원을 아예 만들지 않음
+            # 포인트당 레코드가 X,Y,Z만으로 줄어(18→12바이트) 파이프라인
+            # 대역폭과 출력 파일이 ~33% 감소. 뷰어는 무색 PLY에 기본 머티리얼
+            # 색을 적용하므로 렌더 결과는 기존 단색 베이크와 동일
+            logger.info("skipping_fallback_color", reason="no_color_data")
+
+        if assign_values:
             pipeline_stages.append({
                 "type": "filters.assign",
-                "value": [
-                    "Red = (Z + 50) * 2 + 55",
-                    "Green = 180",
-                    "Blue = (50 - Z) * 2 + 55"
-                ]
+                "value": assign_values
             })
-            output_has_color = True
+
+        # 출력 (바이너리 형식으로 파일 크기 최소화)
+        if output_format == "laz":
+            # 압축 LAZ: 다운로드 용량을 크게 줄임 (뷰어가 LAZ를 지원할 때 사용)
+            pipeline_stages.append({
+                "type": "writers.las",
+                "filename": str(output_path),
+                "compression": "lazperf",
+                "minor_version": 4
+            })
+        else:
+            output_dims = "X,Y,Z,Red,Green,Blue" if output_has_color else "X,Y,Z"
+            pipeline_stages.append({
+                "type": "writers.ply",
+                "filename": str(output_path),
+                "storage_mode": "little endian",
+                "dims": output_dims
+            })
+
+        return pipeline_stages
+
+    def _convert_e57_to_ply(
+        self,
+        source: Path,
+        options: dict,
+        progress_callback: Callable[[int], None] = None
+    ) -> ConversionResult:
+        """E57 → PLY 변환 (PDAL 사용, 웹 뷰어용 다운샘플링 포함)
+
+        기본 출력은 바이너리 PLY (프론트엔드 PLY 로더 호환).
+        options["output_format"]="laz"로 압축 LAZ 출력을 선택할 수 있습니다.
+        """
+        output_format = str(options.get("output_format", "ply")).lower()
+        if output_format not in ("ply", "laz"):
+            logger.warning("unsupported_output_format_fallback_ply", output_format=output_format)
+            output_format = "ply"
+
+        output_name = source.stem + "." + output_format
+        output_path = self.output_base / output_name
+
+        # 좌표계/색상 감지는 서로 독립적인 PDAL 스캔 → 동시 실행
+        # (각각 subprocess 또는 I/O 대기가 대부분이라 스레드로 겹치면 절반으로 단축)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            coord_future = pool.submit(self._detect_coordinate_system, source, "e57")
+            color_future = pool.submit(self._detect_color_info, source, "e57")
+            coord_info = coord_future.result()
+            color_info = color_future.result()
+
+        is_geographic = coord_info.get("is_geographic", False)
+        is_swapped_geo = coord_info.get("is_swapped", False)  # X/Y가 작고 Z가 위도인 경우
+        is_korea_tm = coord_info.get("is_korea_tm", False)
+        is_projected = coord_info.get("is_projected", False)
+        point_count = coord_info.get("point_count", 0)
+
+        # bounds 유효성 검사 (Infinity, NaN 체크)
+        bbox = coord_info.get("bbox")
+        has_valid_bounds = False
+        if bbox:
+            import math
+            has_valid_bounds = all(
+                not math.isinf(v) and not math.isnan(v)
+                for v in bbox
+            )
+            if not has_valid_bounds:
+                logger.warning("invalid_bounds_detected", bbox=bbox)
+                bbox = None
+
+        # 색상 정보 (위에서 좌표계 감지와 병렬로 수집됨)
+        has_color = color_info.get("has_color", False)
+        is_16bit_color = color_info.get("is_16bit", False)
+
+        # 복셀 크기 결정
+        if is_geographic:
+            # 지리 좌표계: 도(degree) 단위이므로 훨씬 작은 값 사용
+            # 0.00001도 ≈ 약 1.1m (적도 기준)
+            voxel_size = options.get("voxel_size", 0.00001)
+            logger.info("using_geographic_voxel_size", voxel_size=voxel_size)
+        elif is_korea_tm or is_projected:
+            # 한국 TM 또는 UTM 좌표계: 미터 단위
+            # 0.05m = 5cm 간격
+            voxel_size = options.get("voxel_size", 0.05)
+            logger.info("using_projected_voxel_size", voxel_size=voxel_size, is_korea_tm=is_korea_tm)
         else:
-            # 색상 없음 + 정규화 안됨 - 단색 출력
-            logger.info("generating_fallback_color", reason="no_color_no_normalization")
-            # filters.assign으로 직접 RGB 값 생성
-            pipeline_stages.append({
-                "type": "filters.assign",
-                "value": [
-                    "Red = 150",
-                    "Green = 180",
-                    "Blue = 210"
-                ]
-            })
-            output_has_color = True
+            # 기타 좌표계: 미터 단위 가정
+            # 0.05m = 5cm 간격
+            voxel_size = options.get("voxel_size", 0.05)
 
-        # 출력 (바이너리 형식으로 파일 크기 최소화)
-        output_dims = "X,Y,Z,Red,Green,Blue" if output_has_color else "X,Y,Z"
-        pipeline_stages.append({
-            "type": "writers.ply",
-            "filename": str(output_path),
-            "storage_mode": "little endian",
-            "dims": output_dims
-        })
+        # 좌표계 변환 여부 (Z-up → Y-up)
+        # 프론트엔드 PLY 로더에서 별도 회전을 적용하지 않으므로,
+        # 한국 TM / 투영 좌표계(명확히 Z-up)만 변환, 나머지는 원본 유지
+        # (E57 스캐너 데이터는 이미 Y-up이거나 방향이 다양하여 일괄 변환 시 눕혀짐)
+        transform_coords = options.get("transform_coords", is_korea_tm or is_projected)
 
-        pipeline = {"pipeline": pipeline_stages}
+        # 파이프라인 생성은 입력 형상 요약(ctx)을 받아 전용 빌더로 위임 —
+        # 분기 로직이 한 곳에 모여 형상별 특수화/캐싱이 쉬움
+        ctx = _PipelineContext(
+            source=source,
+            output_path=output_path,
+            output_format=output_format,
+            voxel_size=voxel_size,
+            point_count=point_count,
+            bbox=bbox,
+            has_valid_bounds=has_valid_bounds,
+            is_geographic=is_geographic,
+            is_korea_tm=is_korea_tm,
+            is_projected=is_projected,
+            has_color=has_color,
+            is_16bit_color=is_16bit_color,
+            transform_coords=transform_coords,
+            force_default_color=bool(options.get("force_default_color", False)),
+        )
+        pipeline = {"pipeline": self._build_e57_pipeline_stages(ctx)}
 
         result = self._run_pdal_pipeline(pipeline, output_path, progress_callback)
 
@@ -826,27 +2109,26 @@ class SpatialConverter:
             center_y = (miny + maxy) / 2
             center_z = (minz + maxz) / 2
 
-            # 지리 좌표인 경우 위경도로 변환
+            # 지리 좌표인 경우 위경도로 변환 — 전략 테이블 1회 조회
+            # (is_geographic이 is_korea_tm보다 우선하도록 키를 정규화)
             center_lon = center_lat = None
-            if is_geographic:
-                if is_swapped_geo:
-                    # 좌표가 뒤바뀐 경우: X=lon, Z=lat (Y는 altitude 또는 다른 값)
-                    center_lon = center_x
-                    center_lat = center_z
-                    logger.info("using_swapped_geo_coords",
-                               center_lon=center_lon,
-                               center_lat=center_lat,
-                               original_center_y=center_y)
+            rule = _CENTER_LONLAT_RULES.get((
+                is_geographic,
+                is_geographic and is_swapped_geo,
+                (not is_geographic) and is_korea_tm,
+            ))
+            if rule is not None:
+                lon_lat = rule(center_x, center_y, center_z)
+                if all(math.isfinite(v) for v in lon_lat):
+                    center_lon, center_lat = lon_lat
+                    if is_geographic and is_swapped_geo:
+                        logger.info("using_swapped_geo_coords",
+                                   center_lon=center_lon,
+                                   center_lat=center_lat,
+                                   original_center_y=center_y)
                 else:
-                    center_lon = center_x
-                    center_lat = center_y
-            elif is_korea_tm:
-                # 한국 TM → WGS84 변환 (근사치)
-                try:
-                    center_lon = 127.0 + (center_x - 200000) / 89000
-                    center_lat = 38.0 + (center_y - 500000) / 111000
-                except Exception:
-                    pass
+                    # 조용히 삼키지 않고 비정상 수치를 남김
+                    logger.warning("center_lonlat_not_finite", lon_lat=lon_lat)
 
             spatial_info = {
                 "epsg": 4326 if is_geographic else (5186 if is_korea_tm else None),
@@ -895,23 +2177,74 @@ class SpatialConverter:
         output_name = source.stem + ".las"
         output_path = self.output_base / output_name
 
-        # PDAL 파이프라인 구성
-        pipeline = {
-            "pipeline": [
-                {
-                    "type": "readers.e57",
-                    "filename": str(source)
-                },
-                {
-                    "type": "writers.las",
-                    "filename": str(output_path),
-                    "compression": "none",
-                    "minor_version": 4
-                }
-            ]
-        }
+        # 사전 직렬화 템플릿에 파일명만 치환 (형태 고정 파이프라인).
+        # 따옴표 포함 토큰을 JSON 직렬화된 경로로 통째로 교체해야
+        # 경로에 " 나 \ 가 있어도 유효한 JSON이 유지됨
+        pipeline_bytes = (_E57_TO_LAS_TEMPLATE
+                          .replace(b'"__SRC__"', _json_dumps_bytes(str(source)))
+                          .replace(b'"__DST__"', _json_dumps_bytes(str(output_path))))
+
+        return self._run_pdal_pipeline(pipeline_bytes, output_path, progress_callback)
+
+    # writers.copc 가용 여부 (클래스 단위 1회 프로브 결과)
+    _copc_writer_available: Optional[bool] = None
 
-        return self._run_pdal_pipeline(pipeline, output_path, progress_callback)
+    @classmethod
+    def _has_copc_writer(cls) -> bool:
+        """PDAL에 writers.copc(2.4+)가 있는지 1회 프로브 후 캐시"""
+        if cls._copc_writer_available is None:
+            try:
+                result = subprocess.run(
+                    ["pdal", "--drivers"],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+                cls._copc_writer_available = (
+                    result.returncode == 0 and "writers.copc" in result.stdout)
+            except Exception as e:
+                logger.warning("copc_writer_probe_failed", error=str(e))
+                cls._copc_writer_available = False
+            logger.info("copc_writer_probe",
+                       available=cls._copc_writer_available)
+        return cls._copc_writer_available
+
+    # readers.las threads 옵션 프로브 결과 (0 = 미지원/비활성)
+    _las_reader_threads_cached: Optional[int] = None
+
+    @classmethod
+    def _laz_reader_threads(cls) -> int:
+        """LAZ 읽기에 쓸 readers.las threads 값 (0이면 옵션 생략)
+
+        LASzip 압축 해제는 기본 단일 스레드 — readers.las의 threads
+        옵션(PDAL 2.1+)이 있으면 청크 단위 병렬 해제로 읽기가 코어 수에
+        비례해 빨라짐. 동시 변환이 많은 배포에서는 PDAL_READER_THREADS
+        환경변수로 제한하거나 0으로 비활성화 가능
+        """
+        if cls._las_reader_threads_cached is None:
+            env = os.getenv("PDAL_READER_THREADS")
+            if env is not None:
+                try:
+                    cls._las_reader_threads_cached = max(0, int(env))
+                except ValueError:
+                    logger.warning("invalid_pdal_reader_threads", value=env)
+                    cls._las_reader_threads_cached = 0
+            else:
+                threads = 0
+                try:
+                    result = subprocess.run(
+                        ["pdal", "--options", "readers.las"],
+                        capture_output=True,
+                        text=True,
+                        timeout=60
+                    )
+                    if result.returncode == 0 and "threads" in result.stdout:
+                        threads = max(2, (os.cpu_count() or 2) // 2)
+                except Exception as e:
+                    logger.warning("las_reader_threads_probe_failed", error=str(e))
+                cls._las_reader_threads_cached = threads
+            logger.info("las_reader_threads", threads=cls._las_reader_threads_cached)
+        return cls._las_reader_threads_cached
 
     def _convert_to_copc(
         self,
@@ -919,11 +2252,13 @@ class SpatialConverter:
         options: dict,
         progress_callback: Callable[[int], None] = None
     ) -> ConversionResult:
-        """포인트 클라우드 → LAZ 변환 (PDAL 사용)
+        """포인트 클라우드 → COPC/LAZ 변환 (PDAL 사용)
 
-        참고: COPC는 PDAL 2.4+ 필요. 현재는 LAZ(압축 LAS)로 변환합니다.
-        LAZ는 LASzip 압축을 사용하여 파일 크기를 크게 줄입니다.
+        writers.copc(PDAL 2.4+)가 있으면 COPC로 출력 — COPC는 LAZ이면서
+        옥트리 인덱스를 내장해 뷰어가 가시 영역의 청크만 HTTP range로
+        가져올 수 있음 (전체 디코드 불필요). 없으면 기존 LAZ 출력 유지.
         """
+        use_copc = self._has_copc_writer()
         output_name = source.stem + ".laz"
         output_path = self.output_base / output_name
 
@@ -933,6 +2268,49 @@ class SpatialConverter:
             ext = "." + options["original_format"]
             logger.info("using_original_format", format=ext)
 
+        if ext == ".laz":
+            # 이미 LAZ인 입력은 재인코딩(압축 해제 → 재압축)이 순수 낭비 —
+            # 단, 패스스루는 헤더가 정상이고 LAS 1.4+이며 COPC 변환이
+            # 불필요한 경우(writers.copc 부재 또는 입력이 이미 COPC)에만.
+            # COPC writer가 있는데 일반 LAZ를 그대로 통과시키면 옥트리
+            # 인덱스 없는 출력이 나와 COPC 경로의 이점이 사라짐
+            try:
+                import laspy
+                with laspy.open(str(source)) as reader:
+                    header = reader.header
+                is_copc_input = any(
+                    getattr(vlr, "user_id", "") == "copc"
+                    for vlr in (header.vlrs or [])
+                )
+
+                if header.version.minor >= 4 and (is_copc_input or not use_copc):
+                    logger.info("laz_passthrough",
+                               source=str(source),
+                               point_count=header.point_count,
+                               version=str(header.version),
+                               is_copc=is_copc_input)
+
+                    if output_path.exists():
+                        output_path.unlink()
+                    self._link_or_copy(source, output_path)
+
+                    metadata = self._get_pdal_metadata(output_path)
+                    if isinstance(metadata, dict):
+                        metadata["format"] = "copc" if is_copc_input else "laz"
+                    return ConversionResult(
+                        success=True,
+                        output_path=str(output_path),
+                        metadata=metadata
+                    )
+
+                logger.info("laz_passthrough_skipped",
+                           version=str(header.version),
+                           is_copc=is_copc_input,
+                           copc_writer=use_copc)
+            except Exception as e:
+                # 헤더 판독 실패(손상/비표준 파일 등) 시 일반 재인코딩 경로로 진행
+                logger.warning("laz_passthrough_failed", error=str(e))
+
         if ext == ".las" or ext == ".laz":
             reader_type = "readers.las"
         elif ext == ".ply":
@@ -945,23 +2323,45 @@ class SpatialConverter:
                 error=f"지원하지 않는 포인트 클라우드 포맷: {ext}"
             )
 
-        # PDAL 파이프라인 구성 (LAZ 압축 사용)
+        if use_copc:
+            # COPC 출력 (.copc.laz) — 다운스트림 재타일링 패스 제거
+            output_name = source.stem + ".copc.laz"
+            output_path = self.output_base / output_name
+            writer = {
+                "type": "writers.copc",
+                "filename": str(output_path),
+                "forward": "all"  # 모든 dimension 유지
+            }
+        else:
+            writer = {
+                "type": "writers.las",
+                "filename": str(output_path),
+                "compression": "lazperf",  # lazperf 인코더 (단일 패스, 외부 laszip 불필요)
+                "forward": "all"  # 모든 dimension 유지
+            }
+
+        reader = {
+            "type": reader_type,
+            "filename": str(source)
+        }
+        if reader_type == "readers.las" and ext == ".laz":
+            # LAZ 입력은 압축 해제가 지배적 비용 — 지원 시 병렬 해제
+            threads = self._laz_reader_threads()
+            if threads:
+                reader["threads"] = threads
+
+        # PDAL 파이프라인 구성
         pipeline = {
             "pipeline": [
-                {
-                    "type": reader_type,
-                    "filename": str(source)
-                },
-                {
-                    "type": "writers.las",
-                    "filename": str(output_path),
-                    "compression": "laszip",  # LASzip 압축
-                    "forward": "all"  # 모든 dimension 유지
-                }
+                reader,
+                writer
             ]
         }
 
-        return self._run_pdal_pipeline(pipeline, output_path, progress_callback)
+        result = self._run_pdal_pipeline(pipeline, output_path, progress_callback)
+        if result.success and isinstance(result.metadata, dict):
+            result.metadata["format"] = "copc" if use_copc else "laz"
+        return result
 
     def _convert_to_3dtiles(
         self,
@@ -1018,44 +2418,60 @@ class SpatialConverter:
         if progress_callback:
             progress_callback(40)
 
-        # 소스 파일을 출력 디렉토리로 복사
+        # 소스 파일을 출력 디렉토리로 복사 (메타데이터 보존 불필요 —
+        # 같은 파일시스템이면 하드링크/reflink로 바이트 이동 없이 처리)
         output_model = output_dir / source.name
-        shutil.copy2(source, output_model)
+        self._link_or_copy(source, output_model)
 
         if progress_callback:
             progress_callback(60)
 
-        # tileset.json 생성
-        # 참고: 실제 boundingVolume은 모델에서 추출해야 하지만,
-        # 여기서는 기본값 사용
-        tileset = {
-            "asset": {
-                "version": "1.0",
-                "tilesetVersion": "1.0.0"
-            },
-            "geometricError": 500,
-            "root": {
-                "boundingVolume": {
-                    "region": [
-                        -3.141592653589793,  # west
-                        -1.5707963267948966, # south
-                        3.141592653589793,   # east
-                        1.5707963267948966,  # north
-                        0,                    # min height
-                        1000                  # max height
-                    ]
-                },
-                "geometricError": 100,
-                "refine": "ADD",
-                "content": {
-                    "uri": source.name
-                }
+        # GLB면 헤더의 accessor min/max에서 실제 바운딩 박스 추출
+        glb_bounds = None
+        if output_model.suffix.lower() == ".glb":
+            glb_bounds = self._extract_glb_bounds(output_model)
+
+        if glb_bounds:
+            bb_min = glb_bounds["min"]
+            bb_max = glb_bounds["max"]
+            center = [(bb_min[i] + bb_max[i]) / 2 for i in range(3)]
+            half = [max((bb_max[i] - bb_min[i]) / 2, 1) for i in range(3)]
+            bounding_volume = {
+                "box": [
+                    center[0], center[1], center[2],
+                    half[0], 0, 0,
+                    0, half[1], 0,
+                    0, 0, half[2]
+                ]
             }
-        }
+            # 실제 크기 기반 geometricError — 카메라 거리에 따른 LOD 컬링이
+            # 동작하려면 박스/오차가 모델 스케일과 맞아야 함.
+            # 대각선 기반이 축 최대값보다 가늘고 긴 모델에서 안정적
+            diagonal = 2 * math.sqrt(sum(h * h for h in half))
+            root_geometric_error = diagonal / 16
+            logger.info("tileset_bounds_from_model",
+                       bb_min=bb_min, bb_max=bb_max,
+                       vertex_count=glb_bounds["vertex_count"])
+        else:
+            # 바운딩 박스를 알 수 없으면 전 지구 region 기본값
+            bounding_volume = {
+                "region": [
+                    -3.141592653589793,  # west
+                    -1.5707963267948966, # south
+                    3.141592653589793,   # east
+                    1.5707963267948966,  # north
+                    0,                    # min height
+                    1000                  # max height
+                ]
+            }
+            root_geometric_error = 100
 
+        # tileset.json 생성
         tileset_path = output_dir / "tileset.json"
-        with open(tileset_path, "w") as f:
-            json.dump(tileset, f, indent=2)
+        _write_file_once(
+            tileset_path,
+            _render_tileset_bytes(bounding_volume, root_geometric_error, source.name)
+        )
 
         if progress_callback:
             progress_callback(90)
@@ -1070,6 +2486,80 @@ class SpatialConverter:
             }
         )
 
+    # 스토리지 인덱스 TTL (초) — 짧게 잡아 업로드 직후 변환도 새 파일을 보게 함
+    _STORAGE_INDEX_TTL = 30.0
+
+    def _get_storage_index(self) -> dict:
+        """스토리지 디렉토리의 {확장자: [(디렉토리명 소문자, 첫 파일)]} 인덱스
+
+        MTL/텍스처 참조마다 중첩 iterdir 검색을 반복하면 참조 수에 비례해
+        디렉토리 전체를 재순회함 (네트워크/FUSE 스토리지에서 특히 느림).
+        한 번 순회로 확장자별 인덱스를 구성해 각 조회를 해당 확장자
+        후보로 좁히고, 짧은 TTL + 디렉토리 mtime 검사로 재사용
+        """
+        storage_user_dir = self.storage_path / "spatial-files"
+        signature = self._storage_index_signature(storage_user_dir)
+
+        cached = self._storage_index
+        if cached is not None and signature is not None:
+            built_at, cached_sig, index = cached
+            if (cached_sig == signature
+                    and time.monotonic() - built_at < self._STORAGE_INDEX_TTL):
+                return index
+
+        # os.scandir는 getdents64가 돌려준 d_type을 DirEntry에 캐시하므로
+        # is_dir() 판정에 entry별 추가 stat 호출이 없음 (iterdir + is_dir 대비
+        # syscall 약 절반 — 네트워크 스토리지 마운트에서 체감 큼)
+        index: dict[str, list] = {}
+        try:
+            with os.scandir(storage_user_dir) as user_it:
+                for user_dir in user_it:
+                    if not user_dir.is_dir(follow_symlinks=False):
+                        continue
+                    with os.scandir(user_dir.path) as item_it:
+                        for item in item_it:
+                            if not item.is_dir(follow_symlinks=False):
+                                continue
+                            first_file = None
+                            with os.scandir(item.path) as file_it:
+                                for entry in file_it:
+                                    first_file = Path(entry.path)
+                                    break
+                            if first_file is not None:
+                                name_lower = item.name.lower()
+                                ext = Path(name_lower).suffix
+                                index.setdefault(ext, []).append(
+                                    (name_lower, first_file))
+        except OSError as e:
+            logger.warning("storage_index_failed", error=str(e))
+
+        self._storage_index = (time.monotonic(), signature, index)
+        return index
+
+    @staticmethod
+    def _storage_index_signature(storage_user_dir: Path) -> Optional[tuple]:
+        """스토리지 인덱스 유효성 서명: 루트 + 사용자 디렉토리별 mtime
+
+        새 항목 디렉토리는 상위(사용자) 디렉토리의 mtime만 갱신하고
+        루트 mtime은 그대로 둠 — 루트 하나만 보면 업로드 직후 변환이
+        TTL 동안 stale 인덱스로 MTL/텍스처를 놓침. 실제 순회 대상인
+        사용자 디렉토리 mtime까지 포함해 업로드가 즉시 무효화를 유발함
+        (전체 재순회 대비 루트 scandir 1회 + 사용자 디렉토리 stat만 비용)
+        """
+        try:
+            sig = [storage_user_dir.stat().st_mtime_ns]
+            with os.scandir(storage_user_dir) as it:
+                for entry in sorted(it, key=lambda e: e.name):
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    try:
+                        sig.append(entry.stat(follow_symlinks=False).st_mtime_ns)
+                    except OSError:
+                        return None
+            return tuple(sig)
+        except OSError:
+            return None
+
     def _prepare_obj_files(
         self,
         source: Path,
@@ -1083,13 +2573,11 @@ class SpatialConverter:
         Returns:
             tuple[Path, Path]: (준비된 OBJ 파일 경로, 임시 디렉토리 경로)
         """
-        import re
-
-        # 임시 작업 디렉토리 생성
-        work_dir = self.temp_path / f"obj_prep_{source.stem}"
-        if work_dir.exists():
-            shutil.rmtree(work_dir)
-        work_dir.mkdir(parents=True)
+        # 작업 디렉토리: convert()가 관리하는 per-변환 TemporaryDirectory
+        # 아래에 생성 — 실패 경로 포함 정리가 상위에서 보장되므로
+        # 기존의 rmtree/재생성과 메서드별 수동 정리가 불필요
+        base_dir = options.get("_workdir") or self.temp_path
+        work_dir = Path(tempfile.mkdtemp(prefix="obj_prep_", dir=base_dir))
 
         # 원본 파일명 (options에서 가져오거나 디렉토리명에서 추출)
         original_name = options.get("original_name")
@@ -1107,102 +2595,65 @@ class SpatialConverter:
 
         # OBJ 파일 복사
         obj_dest = work_dir / original_name
-        shutil.copy2(source, obj_dest)
+        self._link_or_copy(source, obj_dest)
         logger.info("obj_file_prepared", source=str(source), dest=str(obj_dest))
 
         # OBJ 파일에서 MTL 참조 찾기
+        # mtllib 선언은 정점 데이터보다 앞(헤더)에 오므로 첫 1MiB만 보면 충분.
+        # mmap + 사전 컴파일 바이트 정규식으로 라인 단위 디코딩/분기 제거
         mtl_names = []
         try:
-            with open(source, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    if line.startswith('mtllib '):
-                        mtl_name = line.strip().split(' ', 1)[1].strip()
-                        mtl_names.append(mtl_name)
+            import mmap
+            with open(source, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    header = mm[:1 << 20]
+            for m in _OBJ_MTLLIB_RE.finditer(header):
+                mtl_names.append(m.group(1).strip().decode('utf-8', errors='ignore'))
         except Exception as e:
             logger.warning("obj_parse_error", error=str(e))
 
         logger.info("mtl_references_found", mtl_names=mtl_names)
 
-        # 스토리지에서 MTL 파일 찾기
-        storage_user_dir = self.storage_path / "spatial-files"
-        texture_names = []
+        # 확장자별 스토리지 인덱스 (TTL 캐시 — 연속 OBJ 변환에 재사용)
+        storage_index = self._get_storage_index()
 
+        # 인덱스에서 MTL 파일 찾기
+        texture_names = []
         for mtl_name in mtl_names:
-            # 스토리지에서 MTL 파일 검색
-            mtl_found = False
-            for user_dir in storage_user_dir.iterdir():
-                if not user_dir.is_dir():
-                    continue
-                for item in user_dir.iterdir():
-                    # 디렉토리명이 .mtl로 끝나는지 확인
-                    if item.is_dir() and item.name.endswith('.mtl'):
-                        # 디렉토리 내부의 실제 파일 찾기
-                        files = list(item.iterdir())
-                        if files:
-                            mtl_source = files[0]
-                            mtl_dest = work_dir / mtl_name
-                            shutil.copy2(mtl_source, mtl_dest)
-                            logger.info("mtl_file_copied", source=str(mtl_source), dest=str(mtl_dest))
-                            mtl_found = True
-
-                            # MTL 파일에서 텍스처 참조 찾기
-                            try:
-                                with open(mtl_source, 'r', encoding='utf-8', errors='ignore') as f:
-                                    for line in f:
-                                        # map_Kd, map_Ka, map_Ks 등 텍스처 맵 참조
-                                        if line.strip().startswith(('map_', 'bump', 'disp', 'decal')):
-                                            parts = line.strip().split()
-                                            if len(parts) >= 2:
-                                                tex_name = parts[-1]
-                                                texture_names.append(tex_name)
-                            except Exception as e:
-                                logger.warning("mtl_parse_error", error=str(e))
-                            break
-                if mtl_found:
-                    break
+            for item_name, item_file in storage_index.get('.mtl', []):
+                mtl_dest = work_dir / mtl_name
+                self._link_or_copy(item_file, mtl_dest)
+                logger.info("mtl_file_copied", source=str(item_file), dest=str(mtl_dest))
+
+                # MTL 파일에서 텍스처 참조 찾기 (map_Kd, map_Ka, bump 등)
+                try:
+                    mtl_bytes = item_file.read_bytes()
+                    for m in _MTL_MAP_RE.finditer(mtl_bytes):
+                        parts = m.group(1).split()
+                        if parts:
+                            texture_names.append(
+                                parts[-1].decode('utf-8', errors='ignore'))
+                except Exception as e:
+                    logger.warning("mtl_parse_error", error=str(e))
+                break
 
         logger.info("texture_references_found", texture_names=texture_names)
 
-        # 스토리지에서 텍스처 파일 찾기
+        # 인덱스에서 텍스처 파일 찾기
         # Supabase 스토리지 형식: "timestamp_originalname.ext"
         # 예: samyang.jpg → 1769688123384_samyang.jpg
         for tex_name in texture_names:
-            tex_found = False
             tex_ext = Path(tex_name).suffix.lower()
-            tex_stem = Path(tex_name).stem
-
-            for user_dir in storage_user_dir.iterdir():
-                if not user_dir.is_dir():
-                    continue
-                for item in user_dir.iterdir():
-                    # 디렉토리명이 같은 확장자로 끝나는지 확인
-                    if not (item.is_dir() and item.name.lower().endswith(tex_ext)):
-                        continue
-
-                    # 매칭 조건:
-                    # 1. 정확히 일치: timestamp_texname.ext (예: 1769688123384_samyang.jpg)
-                    # 2. 텍스처명이 포함됨: *_texname.ext
-                    item_name = item.name.lower()
-                    tex_name_lower = tex_name.lower()
-                    matched = False
-
-                    # timestamp_originalname.ext 형식 매칭
-                    if item_name.endswith(f'_{tex_name_lower}'):
-                        matched = True
-                    # 텍스처명이 디렉토리명에 포함된 경우
-                    elif tex_name_lower in item_name:
-                        matched = True
-
-                    if matched:
-                        files = list(item.iterdir())
-                        if files:
-                            tex_source = files[0]
-                            tex_dest = work_dir / tex_name
-                            shutil.copy2(tex_source, tex_dest)
-                            logger.info("texture_file_copied", source=str(tex_source), dest=str(tex_dest))
-                            tex_found = True
-                            break
-                if tex_found:
+            tex_name_lower = tex_name.lower()
+
+            for item_name, item_file in storage_index.get(tex_ext, []):
+                # 매칭 조건:
+                # 1. 정확히 일치: timestamp_texname.ext (예: 1769688123384_samyang.jpg)
+                # 2. 텍스처명이 포함됨: *_texname.ext
+                if item_name.endswith(f'_{tex_name_lower}') or tex_name_lower in item_name:
+                    tex_dest = work_dir / tex_name
+                    self._link_or_copy(item_file, tex_dest)
+                    logger.info("texture_file_copied", source=str(item_file), dest=str(tex_dest))
                     break
 
         return obj_dest, work_dir
@@ -1220,22 +2671,31 @@ class SpatialConverter:
         2. OBJ → GLB 변환 (obj2gltf 또는 gltfpack 사용)
         3. GLB → 3D Tiles tileset 생성
         4. 공간 정보 추출 및 메타데이터에 포함
+
+        동시성 모델: 이 메서드는 동기 함수로 유지 — 서버가 convert를
+        asyncio.to_thread/convert_many 워커 스레드에서 실행하므로,
+        blocking subprocess 호출 중에도 다른 변환 작업의 Node 기동과
+        디스크 I/O가 병렬로 진행됨. 단일 변환 내부의 단계(obj2gltf →
+        gltf-transform)는 앞 단계 출력에 의존해 비동기화 이득이 없음.
         """
         if progress_callback:
             progress_callback(5)
 
-        # OBJ에서 공간 정보 추출
-        spatial_info = self._extract_obj_spatial_info(source)
-
-        # OBJ 관련 파일 준비 (MTL, 텍스처를 임시 디렉토리에 모음)
+        # 공간 정보 추출(OBJ 전체 스캔)과 관련 파일 준비(스토리지 검색 + 복사)는
+        # 서로 독립적인 I/O 작업 → 스레드로 겹쳐 실행해 선행 구간을 단축
         work_dir = None
         transform_info = {}
-        try:
-            prepared_obj, work_dir = self._prepare_obj_files(source, options)
-            logger.info("obj_files_prepared", work_dir=str(work_dir))
-        except Exception as e:
-            logger.warning("obj_prepare_failed", error=str(e))
-            prepared_obj = source  # 실패 시 원본 사용
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            spatial_future = pool.submit(self._extract_obj_spatial_info, source)
+            prepare_future = pool.submit(self._prepare_obj_files, source, options)
+
+            spatial_info = spatial_future.result()
+            try:
+                prepared_obj, work_dir = prepare_future.result()
+                logger.info("obj_files_prepared", work_dir=str(work_dir))
+            except Exception as e:
+                logger.warning("obj_prepare_failed", error=str(e))
+                prepared_obj = source  # 실패 시 원본 사용
 
         if progress_callback:
             progress_callback(10)
@@ -1260,14 +2720,37 @@ class SpatialConverter:
         temp_glb = output_dir / (source.stem + ".glb")
         converted = False
 
+        # 재인제스트 캐시: 같은 OBJ(경로+mtime+size)를 이미 변환했다면
+        # obj2gltf/gltf-transform 파이프라인 전체를 건너뛰고 결과 GLB 재사용
+        glb_cache_key = self._file_cache_key(source)
+        if glb_cache_key:
+            cached_glb = self._glb_cache.get(glb_cache_key)
+            if cached_glb and Path(cached_glb).exists():
+                try:
+                    if Path(cached_glb) != temp_glb:
+                        if temp_glb.exists():
+                            temp_glb.unlink()
+                        self._link_or_copy(Path(cached_glb), temp_glb)
+                    logger.info("glb_ingest_cache_hit", source=str(source))
+                    if progress_callback:
+                        progress_callback(70)
+                    return self._create_glb_tileset(
+                        temp_glb, output_dir, source.stem, spatial_info, progress_callback)
+                except OSError as e:
+                    logger.warning("glb_ingest_cache_copy_failed", error=str(e))
+
         # 방법 1: obj2gltf 사용 (MTL/텍스처 지원이 더 좋음)
         try:
+            if _OBJ2GLTF is None:
+                # import 시 프로브 결과 — spawn 없이 곧바로 다음 방법으로
+                raise FileNotFoundError("obj2gltf")
+
             logger.info("trying_obj2gltf", source=str(prepared_obj))
             # 건축/CAD 소프트웨어는 보통 Z-up 좌표계를 사용
             # --inputUpAxis Z: OBJ가 Z-up인 경우 glTF 표준 Y-up으로 변환
             temp_uncompressed = output_dir / (source.stem + "_uncompressed.glb")
             result = subprocess.run(
-                ["obj2gltf", "-i", str(prepared_obj), "-o", str(temp_uncompressed),
+                [_OBJ2GLTF, "-i", str(prepared_obj), "-o", str(temp_uncompressed),
                  "--binary", "--inputUpAxis", "Z"],
                 capture_output=True,
                 text=True,
@@ -1279,92 +2762,128 @@ class SpatialConverter:
                 logger.info("obj2gltf_success", output=str(temp_uncompressed))
                 original_size = temp_uncompressed.stat().st_size
 
-                # gltf-transform으로 텍스처 압축 (WebP)
-                try:
-                    logger.info("compressing_with_gltf_transform", source=str(temp_uncompressed))
-
-                    # 중간 파일 (리사이즈 후)
-                    temp_resized = output_dir / (source.stem + "_resized.glb")
-
-                    # Step 1: 텍스처 해상도 축소 (2048px 이하로 제한)
-                    resize_result = subprocess.run(
-                        ["npx", "gltf-transform", "resize",
-                         str(temp_uncompressed), str(temp_resized),
-                         "--width", "2048", "--height", "2048"
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=300
-                    )
-
-                    resize_input = temp_resized if (resize_result.returncode == 0 and temp_resized.exists()) else temp_uncompressed
-
-                    # Step 2: 텍스처를 WebP로 압축
-                    temp_compressed = output_dir / (source.stem + "_compressed.glb")
-                    compress_result = subprocess.run(
-                        ["npx", "gltf-transform", "webp",
-                         str(resize_input), str(temp_compressed)
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=600
-                    )
-
-                    # 중간 파일 정리
-                    if temp_resized.exists():
-                        temp_resized.unlink()
-
-                    compress_input = temp_compressed if (compress_result.returncode == 0 and temp_compressed.exists()) else resize_input
-
-                    # Step 3: 모델을 원점에 중심 정렬 (Cesium 3D Tiles용)
-                    # WGS84 좌표가 그대로 있으면 tileset transform과 충돌
-                    logger.info("centering_model_for_3dtiles")
-                    temp_centered = output_dir / (source.stem + "_centered.glb")
-                    center_result = subprocess.run(
-                        ["npx", "gltf-transform", "center",
-                         str(compress_input), str(temp_centered)
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=300
-                    )
-
-                    # 압축된 중간 파일 정리
-                    if temp_compressed.exists() and temp_compressed != temp_centered:
-                        temp_compressed.unlink()
+                # 융합 Node 스크립트 우선: 문서를 1회 로드해 WebP 압축 +
+                # 센터링(+Draco)을 메모리에서 적용 — npx 재기동 2회와 중간 GLB
+                # 디스크 왕복을 제거. 스크립트 미존재/실패 시 단계별 CLI fallback
+                if self._run_glb_pipeline_script(temp_uncompressed, temp_glb):
+                    converted = True
+                    final_size = temp_glb.stat().st_size
+                    if temp_uncompressed.exists():
+                        temp_uncompressed.unlink()
+                    logger.info("glb_pipeline_fused_success",
+                               original_mb=f"{original_size/1024/1024:.1f}",
+                               final_mb=f"{final_size/1024/1024:.1f}",
+                               wgs84_pretransformed=spatial_info.get('is_geographic', False))
+                else:
+                    # 단계별 CLI fallback — 각 단계는 성공 시에만 current를
+                    # 전진시키며 직전 중간 파일을 정리하고, 최종 rename은 1회만
+                    try:
+                        logger.info("compressing_with_gltf_transform", source=str(temp_uncompressed))
+                        current = temp_uncompressed
+
+                        # Step 1+2 융합: optimize 한 번으로 리사이즈(2048px) + WebP 압축
+                        # GLB를 한 번만 파싱/직렬화하므로 중간 GLB 왕복이 없음
+                        # --compress draco: 지오메트리 Draco 압축 (~90% 축소,
+                        # 클라이언트는 WASM 병렬 디코드 — 브라우저 OBJ 파싱 대비 수십 배 빠름)
+                        temp_compressed = output_dir / (source.stem + "_compressed.glb")
+                        fused_result = subprocess.run(
+                            self._cli_prefix("gltf-transform") + ["optimize",
+                             str(current), str(temp_compressed),
+                             "--compress", "draco", "--simplify", "false",
+                             "--texture-compress", "webp",
+                             "--texture-size", "2048"
+                            ],
+                            capture_output=True,
+                            text=True,
+                            timeout=600
+                        )
+
+                        if fused_result.returncode == 0 and temp_compressed.exists():
+                            current = temp_compressed
+                        else:
+                            # fallback: resize → webp 2단계 (구버전 CLI 호환)
+                            logger.warning("gltf_transform_optimize_failed",
+                                          stderr=fused_result.stderr[:300] if fused_result.stderr else "")
+
+                            # Step 1: 텍스처 해상도 축소 (2048px 이하로 제한)
+                            # 모든 텍스처가 이미 한도 이내면 디코드/재인코드
+                            # 전체가 무의미 — 헤더 프로브로 단계 자체를 생략
+                            if not _glb_textures_exceed(current, 2048):
+                                logger.info("texture_resize_skipped",
+                                           reason="textures_within_limit")
+                            else:
+                                temp_resized = output_dir / (source.stem + "_resized.glb")
+                                resize_result = subprocess.run(
+                                    self._cli_prefix("gltf-transform") + ["resize",
+                                     str(current), str(temp_resized),
+                                     "--width", "2048", "--height", "2048"
+                                    ],
+                                    capture_output=True,
+                                    text=True,
+                                    timeout=300
+                                )
+                                if resize_result.returncode == 0 and temp_resized.exists():
+                                    current = temp_resized
+
+                            # Step 2: 텍스처를 WebP로 압축
+                            compress_result = subprocess.run(
+                                self._cli_prefix("gltf-transform") + ["webp",
+                                 str(current), str(temp_compressed)
+                                ],
+                                capture_output=True,
+                                text=True,
+                                timeout=600
+                            )
+                            if compress_result.returncode == 0 and temp_compressed.exists():
+                                if current != temp_uncompressed:
+                                    current.unlink()
+                                current = temp_compressed
+
+                        # Step 3: 모델을 원점에 중심 정렬 (Cesium 3D Tiles용)
+                        # WGS84 좌표가 그대로 있으면 tileset transform과 충돌
+                        logger.info("centering_model_for_3dtiles")
+                        temp_centered = output_dir / (source.stem + "_centered.glb")
+                        center_result = subprocess.run(
+                            self._cli_prefix("gltf-transform") + ["center",
+                             str(current), str(temp_centered)
+                            ],
+                            capture_output=True,
+                            text=True,
+                            timeout=300
+                        )
+
+                        centered = (center_result.returncode == 0
+                                    and temp_centered.exists())
+                        if centered:
+                            if current != temp_uncompressed:
+                                current.unlink()
+                            current = temp_centered
+                        else:
+                            logger.warning("gltf_transform_center_failed",
+                                          stderr=center_result.stderr,
+                                          stdout=center_result.stdout)
+                            # 센터링 실패 시 직전 결과 사용 (센터링 없이)
+                            logger.warning("using_uncentered_glb", msg="3D Tiles에서 위치가 맞지 않을 수 있음")
 
-                    if center_result.returncode == 0 and temp_centered.exists():
-                        # 센터링된 파일을 최종 GLB로 사용
+                        # 최종 rename 1회 — 여기서만 최종 경로가 생김
                         # (WGS84 스케일링은 obj2gltf 전에 OBJ 좌표 변환으로 처리됨)
-                        temp_centered.rename(temp_glb)
+                        current.rename(temp_glb)
+                        if current != temp_uncompressed and temp_uncompressed.exists():
+                            temp_uncompressed.unlink()
 
                         converted = True
                         final_size = temp_glb.stat().st_size
-                        # 압축되지 않은 임시 파일 삭제
-                        if temp_uncompressed.exists():
-                            temp_uncompressed.unlink()
                         logger.info("gltf_transform_pipeline_success",
                                    original_mb=f"{original_size/1024/1024:.1f}",
                                    final_mb=f"{final_size/1024/1024:.1f}",
-                                   centered=True,
+                                   centered=centered,
                                    wgs84_pretransformed=spatial_info.get('is_geographic', False))
-                    else:
-                        logger.warning("gltf_transform_center_failed",
-                                      stderr=center_result.stderr,
-                                      stdout=center_result.stdout)
-                        # 센터링 실패 시 압축된 파일 사용 (센터링 없이)
-                        if compress_input.exists() and compress_input != temp_glb:
-                            compress_input.rename(temp_glb)
-                        elif temp_uncompressed.exists():
+                    except Exception as e:
+                        logger.warning("gltf_transform_compression_error", error=str(e))
+                        # 압축 실패 시 비압축 파일 사용
+                        if temp_uncompressed.exists():
                             temp_uncompressed.rename(temp_glb)
-                        converted = True
-                        logger.warning("using_uncentered_glb", msg="3D Tiles에서 위치가 맞지 않을 수 있음")
-                except Exception as e:
-                    logger.warning("gltf_transform_compression_error", error=str(e))
-                    # 압축 실패 시 비압축 파일 사용
-                    if temp_uncompressed.exists():
-                        temp_uncompressed.rename(temp_glb)
-                        converted = True
+                            converted = True
             else:
                 logger.warning("obj2gltf_failed", stderr=result.stderr)
 
@@ -1381,6 +2900,9 @@ class SpatialConverter:
         # 방법 2: gltfpack 시도 (obj2gltf 실패 시)
         if not converted:
             try:
+                if _GLTFPACK is None:
+                    raise FileNotFoundError("gltfpack")
+
                 logger.info("trying_gltfpack", source=str(prepared_obj))
                 # gltfpack 최적화 옵션:
                 # -cc: 정점 압축 (quantization)
@@ -1388,7 +2910,7 @@ class SpatialConverter:
                 # -si: 단순화 비율 (0.5 = 50% 폴리곤)
                 temp_gltfpack = output_dir / (source.stem + "_gltfpack.glb")
                 result = subprocess.run(
-                    ["gltfpack", "-i", str(prepared_obj), "-o", str(temp_gltfpack),
+                    [_GLTFPACK, "-i", str(prepared_obj), "-o", str(temp_gltfpack),
                      "-cc", "-tc", "-si", "0.5"],
                     capture_output=True,
                     text=True,
@@ -1401,7 +2923,7 @@ class SpatialConverter:
                     logger.info("centering_gltfpack_model")
                     temp_centered = output_dir / (source.stem + "_gltfpack_centered.glb")
                     center_result = subprocess.run(
-                        ["npx", "gltf-transform", "center",
+                        self._cli_prefix("gltf-transform") + ["center",
                          str(temp_gltfpack), str(temp_centered)
                         ],
                         capture_output=True,
@@ -1438,19 +2960,15 @@ class SpatialConverter:
         if progress_callback:
             progress_callback(60)
 
-        # 임시 작업 디렉토리 정리
-        if work_dir and work_dir.exists():
-            try:
-                shutil.rmtree(work_dir)
-                logger.info("work_dir_cleaned", path=str(work_dir))
-            except Exception as e:
-                logger.warning("work_dir_cleanup_failed", error=str(e))
+        # 작업 디렉토리는 convert()의 TemporaryDirectory가 일괄 정리
 
         if progress_callback:
             progress_callback(70)
 
         # GLB 변환 성공 시 → 3D Tiles 생성
         if converted:
+            if glb_cache_key:
+                self._glb_cache[glb_cache_key] = str(temp_glb)
             return self._create_glb_tileset(temp_glb, output_dir, source.stem, spatial_info, progress_callback)
 
         # 모든 변환 실패 시 OBJ 직접 처리
@@ -1471,8 +2989,27 @@ class SpatialConverter:
         if progress_callback:
             progress_callback(80)
 
-        # 기본 bounding volume (box)
-        bounding_volume = {"box": [0, 0, 0, 100, 0, 0, 0, 100, 0, 0, 0, 100]}
+        # 기본 bounding volume: GLB 헤더의 accessor min/max에서 직접 계산
+        # (struct + json 파싱만 — 파이프라인/외부 도구 실행 없음)
+        glb_bounds = self._extract_glb_bounds(glb_path)
+        if glb_bounds:
+            bb_min = glb_bounds["min"]
+            bb_max = glb_bounds["max"]
+            bv_center = [(bb_min[i] + bb_max[i]) / 2 for i in range(3)]
+            bv_half = [max((bb_max[i] - bb_min[i]) / 2, 1) for i in range(3)]
+            bounding_volume = {
+                "box": [
+                    bv_center[0], bv_center[1], bv_center[2],
+                    bv_half[0], 0, 0,
+                    0, bv_half[1], 0,
+                    0, 0, bv_half[2]
+                ]
+            }
+            # 모델 대각선 길이 기반 — 축 최대값은 가늘고 긴 모델을 과소평가
+            root_geometric_error = 2 * math.sqrt(sum(h * h for h in bv_half))
+        else:
+            bounding_volume = {"box": [0, 0, 0, 100, 0, 0, 0, 100, 0, 0, 0, 100]}
+            root_geometric_error = 100
         root_transform = None
 
         # 지리 좌표가 있으면 box와 transform 사용
@@ -1485,33 +3022,35 @@ class SpatialConverter:
             # 중심점 좌표 (경위도)
             lon = center.get("longitude") or center.get("x", 127.0)
             lat = center.get("latitude") or center.get("y", 37.0)
-            # 고도는 0으로 설정 (지면 기준)
-            # 모델은 gltf-transform center로 Z 중심이 0에 있으므로
-            # 건물 높이의 절반만큼 올려서 바닥이 지면에 닿도록 함
-            height_range = abs(bbox.get("maxZ", 0) - bbox.get("minZ", 0)) if bbox else 0
-            alt = height_range / 2  # 건물 중심을 건물 높이/2 위치에 배치 → 바닥이 지면에
+            alt = 0.0  # bbox 없으면 지면 기준
 
-            # bbox에서 크기 계산 (미터 단위로 변환)
+            # bbox 전체를 (2,3) 배열로 모아 범위/반치수를 한 번에 계산
+            # (height_range를 두 번 계산하던 중복 제거)
             if bbox:
-                # 경위도 범위를 미터로 변환 (1도 ≈ 111km at equator)
-                lon_range = abs(bbox.get("maxX", 0) - bbox.get("minX", 0))
-                lat_range = abs(bbox.get("maxY", 0) - bbox.get("minY", 0))
-                height_range = abs(bbox.get("maxZ", 0) - bbox.get("minZ", 0))
+                import numpy as np
+
+                arr = np.array([
+                    [bbox.get("minX", 0), bbox.get("minY", 0), bbox.get("minZ", 0)],
+                    [bbox.get("maxX", 0), bbox.get("maxY", 0), bbox.get("maxZ", 0)],
+                ], dtype=np.float64)
 
-                # 실제 미터 크기 계산
-                meters_per_degree_lon = 111000 * math.cos(math.radians(lat))
-                meters_per_degree_lat = 111000
+                # 경위도 범위를 미터로 변환 (1도 ≈ 111km at equator)
+                meters_per_deg = np.array(
+                    [111000 * math.cos(math.radians(lat)), 111000, 1.0])
+                extents_m = np.abs(arr[1] - arr[0]) * meters_per_deg
+                # JSON 직렬화/lru_cache 키에 numpy 스칼라가 섞이지 않도록 float화
+                width_m, depth_m, height_m = map(float, extents_m)
 
-                width_m = lon_range * meters_per_degree_lon
-                depth_m = lat_range * meters_per_degree_lat
-                height_m = height_range
+                # 고도는 0으로 설정 (지면 기준)
+                # 모델은 gltf-transform center로 Z 중심이 0에 있으므로
+                # 건물 높이의 절반만큼 올려서 바닥이 지면에 닿도록 함
+                alt = height_m / 2
 
                 # 센터링된 모델용 box 바운딩 볼륨
                 # box: [centerX, centerY, centerZ, xHalf, 0, 0, 0, yHalf, 0, 0, 0, zHalf]
                 # 센터링되어 있으므로 center는 (0,0,0)
-                half_width = max(width_m / 2, 10)  # 최소 10m
-                half_depth = max(depth_m / 2, 10)
-                half_height = max(height_m / 2, 10)
+                half_width, half_depth, half_height = map(
+                    float, np.maximum(extents_m / 2, 10.0))
 
                 bounding_volume = {
                     "box": [
@@ -1521,102 +3060,35 @@ class SpatialConverter:
                         0, 0, half_height  # z-axis half-length
                     ]
                 }
+                root_geometric_error = math.sqrt(
+                    half_width ** 2 + half_depth ** 2 + half_height ** 2) * 2
 
                 logger.info("tileset_box_created",
                            lon=lon, lat=lat, alt=alt,
                            width_m=width_m, depth_m=depth_m, height_m=height_m,
                            half_width=half_width, half_depth=half_depth, half_height=half_height)
 
-            # ECEF 변환 행렬 계산 (중심점 기준)
-            # Cesium의 Transforms.eastNorthUpToFixedFrame과 동일
-            lon_rad = math.radians(lon)
-            lat_rad = math.radians(lat)
-
-            # WGS84 타원체 파라미터
-            a = 6378137.0  # 적도 반경
-            f = 1 / 298.257223563  # 편평률
-            e2 = 2 * f - f * f  # 이심률 제곱
-
-            sin_lat = math.sin(lat_rad)
-            cos_lat = math.cos(lat_rad)
-            sin_lon = math.sin(lon_rad)
-            cos_lon = math.cos(lon_rad)
-
-            # 곡률 반경
-            N = a / math.sqrt(1 - e2 * sin_lat * sin_lat)
-
-            # ECEF 좌표 (중심점)
-            x = (N + alt) * cos_lat * cos_lon
-            y = (N + alt) * cos_lat * sin_lon
-            z = (N * (1 - e2) + alt) * sin_lat
-
-            # GLB 모델 좌표계 → ECEF 변환 행렬
-            #
-            # GLB (obj2gltf --inputUpAxis Z 변환 후):
-            #   X = East, Y = Up, Z = South (Y-up 좌표계)
-            #
-            # ENU (East-North-Up) 좌표계:
-            #   X = East, Y = North, Z = Up
-            #
-            # GLB → ENU 회전 행렬 (모델 좌표 → 로컬 ENU):
-            #   ENU_X = model_X (East)
-            #   ENU_Y = -model_Z (model_Z=South → ENU_Y=North)
-            #   ENU_Z = model_Y (model_Y=Up → ENU_Z=Up)
-            #
-            # 이 회전을 ENU→ECEF 변환에 결합
-            #
-            # ENU→ECEF 기저 벡터:
-            #   East  = [-sin(lon), cos(lon), 0]
-            #   North = [-sin(lat)*cos(lon), -sin(lat)*sin(lon), cos(lat)]
-            #   Up    = [cos(lat)*cos(lon), cos(lat)*sin(lon), sin(lat)]
-            #
-            # 결합 변환 (GLB → ECEF):
-            #   ECEF = East * model_X + North * (-model_Z) + Up * model_Y
-            #        = East * model_X - North * model_Z + Up * model_Y
-            #
-            # Column-major 4x4 행렬:
-            #   col0 = East (model_X 계수)
-            #   col1 = Up (model_Y 계수)
-            #   col2 = -North (model_Z 계수, South 방향이므로 부호 반전)
-            #   col3 = translation
-
-            east = [-sin_lon, cos_lon, 0]
-            north = [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat]
-            up = [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat]
-
-            root_transform = [
-                east[0], east[1], east[2], 0,       # column 0: model_X → East
-                up[0], up[1], up[2], 0,             # column 1: model_Y → Up
-                -north[0], -north[1], -north[2], 0, # column 2: model_Z (South) → -North
-                x, y, z, 1                          # column 3: translation
-            ]
-
-            logger.info("tileset_transform_created", ecef_x=x, ecef_y=y, ecef_z=z)
-
-        # tileset.json 생성
-        tileset = {
-            "asset": {
-                "version": "1.0",
-                "tilesetVersion": "1.0.0"
-            },
-            "geometricError": 500,
-            "root": {
-                "boundingVolume": bounding_volume,
-                "geometricError": 100,
-                "refine": "ADD",
-                "content": {
-                    "uri": glb_path.name
-                }
-            }
-        }
-
-        # transform 추가 (있는 경우)
-        if root_transform:
-            tileset["root"]["transform"] = root_transform
-
+            # ECEF 변환 행렬 (중심점 기준) — 좌표계 유도는 _enu_to_ecef_matrix 참고
+            # 같은 중심점 재변환 시 lru_cache 히트로 삼각함수 계산 생략.
+            # float 연산 경로가 달라도 키가 일치하도록 ~1e-9도 단위로 반올림
+            # (1e-9도 ≈ 0.1mm — 변환 정밀도에는 영향 없음)
+            root_transform = list(_enu_to_ecef_matrix(
+                round(lon, 9), round(lat, 9), round(alt, 4)))
+
+            logger.info("tileset_transform_created",
+                        ecef_x=root_transform[12],
+                        ecef_y=root_transform[13],
+                        ecef_z=root_transform[14])
+
+        # tileset.json 생성 (transform은 있는 경우에만 포함)
+        # geometricError는 실측 half-extent 기반 — 하드코딩 값이면 뷰어가
+        # 거리와 무관하게 항상 최대 LOD로 로드해 스트리밍 이점이 사라짐
         tileset_path = output_dir / "tileset.json"
-        with open(tileset_path, "w") as f:
-            json.dump(tileset, f, indent=2)
+        _write_file_once(
+            tileset_path,
+            _render_tileset_bytes(bounding_volume, root_geometric_error,
+                                  glb_path.name, transform=root_transform or None)
+        )
 
         if progress_callback:
             progress_callback(95)
@@ -1660,47 +3132,64 @@ class SpatialConverter:
 
         # OBJ 파일 복사
         output_obj = output_dir / source.name
-        shutil.copy2(source, output_obj)
-
-        # MTL 파일 복사 (있는 경우)
-        mtl_path = source.with_suffix(".mtl")
-        if mtl_path.exists():
-            shutil.copy2(mtl_path, output_dir / mtl_path.name)
+        self._link_or_copy(source, output_obj)
 
-        # 텍스처 파일 복사 (OBJ와 같은 디렉토리의 이미지)
-        for img_ext in [".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp"]:
-            for img_file in source.parent.glob(f"*{img_ext}"):
-                shutil.copy2(img_file, output_dir / img_file.name)
+        # MTL + 텍스처 파일 복사: 디렉토리를 한 번만 순회
+        # (확장자별 glob 6회는 호출마다 전체 디렉토리를 재나열 + fnmatch 비용)
+        mtl_name = source.with_suffix(".mtl").name
+        copy_jobs = []
+        try:
+            with os.scandir(source.parent) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    if entry.name == mtl_name or IMG_RE.search(entry.name):
+                        copy_jobs.append((entry.path, output_dir / entry.name))
+        except OSError as e:
+            logger.warning("obj_asset_scan_failed", error=str(e))
+
+        if copy_jobs:
+            # copyfile은 Linux에서 sendfile 기반(커널 내 복사) —
+            # 대용량 텍스처 여러 장을 공유 I/O 풀에서 병렬 복사해
+            # 디스크 큐를 채움 (풀 생성 비용은 인스턴스 생성 시 1회)
+            futures = [self._io_pool.submit(self._link_or_copy, Path(src), dst)
+                       for src, dst in copy_jobs]
+            for future in futures:
+                future.result()
 
         if progress_callback:
             progress_callback(70)
 
         # tileset.json 생성 (OBJ 직접 참조 - 뷰어에서 처리 필요)
-        tileset = {
-            "asset": {
-                "version": "1.0",
-                "tilesetVersion": "1.0.0",
-                "extras": {
+        tileset_path = output_dir / "tileset.json"
+        bbox = (spatial_info or {}).get("bbox")
+        if bbox and all(k in bbox for k in ("minX", "minY", "minZ", "maxX", "maxY", "maxZ")):
+            # 실측 bbox가 있으면 실제 boundingVolume.box + geometricError 사용
+            # (하드코딩 박스는 뷰어의 거리 기반 컬링을 무력화함)
+            cx = (bbox["minX"] + bbox["maxX"]) / 2
+            cy = (bbox["minY"] + bbox["maxY"]) / 2
+            cz = (bbox["minZ"] + bbox["maxZ"]) / 2
+            dx = max((bbox["maxX"] - bbox["minX"]) / 2, 1)
+            dy = max((bbox["maxY"] - bbox["minY"]) / 2, 1)
+            dz = max((bbox["maxZ"] - bbox["minZ"]) / 2, 1)
+            root_geometric_error = max(dx, dy, dz)
+            _write_file_once(tileset_path, _render_tileset_bytes(
+                {"box": [cx, cy, cz, dx, 0, 0, 0, dy, 0, 0, 0, dz]},
+                root_geometric_error,
+                source.name,
+                extras={
                     "format": "obj",
                     "note": "OBJ 파일은 뷰어에서 별도 로더 필요"
                 }
-            },
-            "geometricError": 500,
-            "root": {
-                "boundingVolume": {
-                    "box": [0, 0, 0, 100, 0, 0, 0, 100, 0, 0, 0, 100]
-                },
-                "geometricError": 100,
-                "refine": "ADD",
-                "content": {
-                    "uri": source.name
-                }
-            }
-        }
-
-        tileset_path = output_dir / "tileset.json"
-        with open(tileset_path, "w") as f:
-            json.dump(tileset, f, indent=2)
+            ))
+        else:
+            # bbox 미상 — 사전 직렬화된 템플릿에 uri만 치환
+            _write_file_once(
+                tileset_path,
+                _OBJ_TILESET_TEMPLATE.replace(
+                    b'"__URI__"', json.dumps(source.name).encode()
+                )
+            )
 
         if progress_callback:
             progress_callback(90)
@@ -1760,10 +3249,9 @@ class SpatialConverter:
         temp_link = None
         input_path = source
         if not source.suffix and ext:
-            temp_link = self.temp_path / f"pc3dt_{source.stem}{ext}"
-            if temp_link.exists():
-                temp_link.unlink()
-            temp_link.symlink_to(source)
+            temp_link = self._make_temp_symlink(
+                source, "pc3dt", ext.lstrip('.'),
+                base_dir=options.get("_workdir"))
             input_path = temp_link
             logger.info("created_temp_symlink_for_3dtiles", source=str(source), link=str(temp_link))
 
@@ -1771,9 +3259,14 @@ class SpatialConverter:
             progress_callback(20)
 
         try:
-            # 좌표계 정보 감지
-            coord_info = self._detect_coordinate_system(source, ext.lstrip('.'))
-            color_info = self._detect_color_info(source, ext.lstrip('.'))
+            # 좌표계/색상 정보 감지 (독립 스캔이므로 병렬 실행)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                coord_future = pool.submit(
+                    self._detect_coordinate_system, source, ext.lstrip('.'))
+                color_future = pool.submit(
+                    self._detect_color_info, source, ext.lstrip('.'))
+                coord_info = coord_future.result()
+                color_info = color_future.result()
 
             if progress_callback:
                 progress_callback(30)
@@ -1819,24 +3312,35 @@ class SpatialConverter:
             if progress_callback:
                 progress_callback(40)
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1시간 타임아웃
+            # 1시간짜리 실행이 쏟는 로그를 전부 쌓지 않도록 bounded tail
+            # 방식으로 실행 (타임아웃 1시간). py3dtiles가 출력하는 진행률을
+            # 라인 단위로 파싱해 40→80 구간을 실시간으로 채움
+            last_pct = -1
+
+            def _forward_py3dtiles_progress(line: bytes):
+                nonlocal last_pct
+                m = _PROGRESS_PCT_RE.search(line)
+                if m:
+                    pct = min(int(m.group(1)), 100)
+                    if pct > last_pct:
+                        last_pct = pct
+                        progress_callback(40 + int(pct * 0.4))
+
+            returncode, output_tail = self._run_streaming_subprocess(
+                cmd, timeout=3600,
+                line_callback=_forward_py3dtiles_progress if progress_callback else None
             )
 
             if progress_callback:
                 progress_callback(80)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 logger.error("py3dtiles_convert_failed",
-                           returncode=result.returncode,
-                           stderr=result.stderr[:1000] if result.stderr else "",
-                           stdout=result.stdout[:1000] if result.stdout else "")
+                           returncode=returncode,
+                           output_tail=output_tail[:1000])
                 return ConversionResult(
                     success=False,
-                    error=f"3D Tiles 변환 실패: {result.stderr[:500] if result.stderr else 'Unknown error'}"
+                    error=f"3D Tiles 변환 실패: {output_tail[:500] if output_tail else 'Unknown error'}"
                 )
 
             # tileset.json 존재 확인
@@ -1894,10 +3398,10 @@ class SpatialConverter:
                 error=f"3D Tiles 변환 오류: {str(e)}"
             )
         finally:
-            if temp_link and temp_link.exists():
+            if temp_link:
                 try:
-                    temp_link.unlink()
-                except Exception:
+                    temp_link.unlink(missing_ok=True)
+                except OSError:
                     pass
 
     def _convert_e57_to_3dtiles(
@@ -1911,13 +3415,20 @@ class SpatialConverter:
         Cesium에서 E57 포인트 클라우드를 지리 가시화하기 위한 파이프라인입니다.
         1단계: PDAL로 E57 → PLY 변환 (좌표 변환 없이 원본 유지)
         2단계: py3dtiles로 PLY → 3D Tiles (pnts) 변환
+
+        두 단계를 FIFO(pipe)로 융합하지 않는 이유: py3dtiles의 타일링은
+        전체 bounds 산출 후 옥트리 분할을 위해 입력을 여러 번 재독하는
+        multi-pass 구조라 seek 가능한 파일이 필요함. FIFO를 물리면
+        py3dtiles가 재독을 시도하는 순간 실패하거나, PDAL 쪽 write가
+        막혀 양쪽이 교착됨. 대신 중간 PLY는 복사 없이 rename으로
+        단 한 번만 기록/판독되도록 유지함.
         """
         if progress_callback:
             progress_callback(5)
 
         # 1단계: E57 → PLY (임시 파일로)
         logger.info("e57_to_3dtiles_step1", source=str(source))
-        temp_ply = self.temp_path / f"e57_3dt_{source.stem}.ply"
+        temp_ply = (options.get("_workdir") or self.temp_path) / f"e57_3dt_{source.stem}.ply"
 
         try:
             # E57 → PLY 변환 (좌표 변환 비활성화 — py3dtiles가 좌표계 처리)
@@ -1933,10 +3444,22 @@ class SpatialConverter:
                     error=f"E57 → PLY 변환 실패: {ply_result.error}"
                 )
 
-            # PLY 결과 파일을 임시 위치로 이동
+            # PLY 결과 파일을 임시 위치로 이동 — 중간 산출물이라 원본을 남길
+            # 필요가 없으므로 rename(O(1))을 우선하고, 파일시스템이 다르면
+            # 수 GB 복사 대신 symlink로 대체
             ply_output = Path(ply_result.output_path)
             if ply_output != temp_ply:
-                shutil.copy2(str(ply_output), str(temp_ply))
+                src_key = self._file_cache_key(ply_output)
+                try:
+                    os.replace(ply_output, temp_ply)
+                except OSError:
+                    os.symlink(ply_output.resolve(), temp_ply)
+
+                # 원본 PLY에 대해 캐시된 감지 결과를 새 경로로 이관
+                # (2단계에서 temp_ply를 다시 스캔하지 않도록)
+                dst_key = self._file_cache_key(temp_ply)
+                if src_key and dst_key and src_key in self._coord_cache:
+                    self._coord_cache[dst_key] = dict(self._coord_cache[src_key])
 
             if progress_callback:
                 progress_callback(50)
@@ -1974,12 +3497,12 @@ class SpatialConverter:
                 error=f"E57 → 3D Tiles 변환 오류: {str(e)}"
             )
         finally:
-            # 임시 PLY 파일 정리
-            if temp_ply.exists():
-                try:
-                    temp_ply.unlink()
-                except Exception:
-                    pass
+            # 임시 PLY 파일 정리 — symlink인 경우에도 링크 자체만 제거
+            # (exists()는 깨진 symlink에서 False라 lexists 의미의 unlink 사용)
+            try:
+                temp_ply.unlink(missing_ok=True)
+            except Exception:
+                pass
 
     def _run_pdal_pipeline(
         self,
@@ -1987,46 +3510,110 @@ class SpatialConverter:
         output_path: Path,
         progress_callback: Callable[[int], None] = None
     ) -> ConversionResult:
-        """PDAL 파이프라인 실행"""
+        """PDAL 파이프라인 실행
+
+        바인딩이 있으면 in-process 스트리밍 실행 (streamable stage 구성 시
+        전체 포인트 클라우드를 RAM에 올리지 않고 chunk 단위로 처리).
+        PDAL 라이브러리는 서비스 프로세스에 한 번만 로드되므로 변환마다
+        fork/exec + 동적 링킹 초기화 비용(~100ms)이 들지 않습니다.
+
+        미설치 환경에서는 PDAL CLI subprocess로 fallback. CLI는 호출당
+        파이프라인 하나를 처리하고 종료하는 구조라(다중 요청 stdin 프로토콜
+        없음) 상주 워커로 만들 수 없습니다.
+        """
         if progress_callback:
             progress_callback(20)
 
-        # 파이프라인 JSON 파일 생성
-        pipeline_file = self.temp_path / "pipeline.json"
-        with open(pipeline_file, "w") as f:
-            json.dump(pipeline, f, indent=2)
+        # 사전 직렬화된 bytes 템플릿 또는 dict 둘 다 수용
+        if isinstance(pipeline, (bytes, bytearray)):
+            pipeline_text = bytes(pipeline).decode('utf-8')
+            pipeline_dict = None  # 필요 시(CLI fallback)에만 지연 파싱
+        else:
+            pipeline_dict = pipeline
+            pipeline_text = json.dumps(pipeline)
 
         # 디버깅: 파이프라인 내용 로깅
         logger.info("pdal_pipeline_generated",
-                   pipeline_file=str(pipeline_file),
-                   pipeline_content=json.dumps(pipeline, indent=2)[:2000])
+                   pipeline_content=pipeline_text[:2000])
 
         if progress_callback:
             progress_callback(30)
 
         try:
-            # PDAL 실행
-            result = subprocess.run(
-                ["pdal", "pipeline", str(pipeline_file)],
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1시간 타임아웃
-            )
+            if pdal is not None:
+                pdal_pipeline = pdal.Pipeline(pipeline_text)
+
+                # 실행 중 진행률 하트비트 (30→75%): execute_streaming은 완료까지
+                # 반환하지 않으므로 워커 스레드에서 주기적으로 progress를 올림
+                stop_heartbeat = threading.Event()
+                heartbeat = None
+                if progress_callback:
+                    def _progress_heartbeat():
+                        progress = 30
+                        while not stop_heartbeat.wait(5.0) and progress < 75:
+                            progress += 5
+                            progress_callback(progress)
+
+                    heartbeat = threading.Thread(target=_progress_heartbeat, daemon=True)
+                    heartbeat.start()
 
-            if progress_callback:
-                progress_callback(80)
+                try:
+                    if pdal_pipeline.streamable:
+                        # readers.e57/las, filters.assign/transformation/decimation,
+                        # writers.ply/las 등은 모두 streamable → 메모리 상한 고정
+                        # (스트리밍 모드는 chunk 크기의 버퍼 하나를 선할당해 재사용)
+                        logger.info("pdal_executing_streaming",
+                                   chunk_size=PDAL_STREAM_CHUNK_SIZE)
+                        executed_points = pdal_pipeline.execute_streaming(
+                            chunk_size=PDAL_STREAM_CHUNK_SIZE)
+                    else:
+                        logger.info("pdal_executing_standard", reason="pipeline_not_streamable")
+                        executed_points = pdal_pipeline.execute()
+                finally:
+                    stop_heartbeat.set()
+                    if heartbeat:
+                        heartbeat.join()
 
-            if result.returncode != 0:
-                logger.error("pdal_pipeline_failed",
-                           returncode=result.returncode,
-                           stderr=result.stderr[:1000] if result.stderr else "",
-                           stdout=result.stdout[:1000] if result.stdout else "",
-                           pipeline_stages=[s.get("type") for s in pipeline.get("pipeline", [])])
-                return ConversionResult(
-                    success=False,
-                    error=f"PDAL 실행 실패: {result.stderr}"
+                logger.info("pdal_pipeline_executed", point_count=executed_points)
+
+            else:
+                # fallback: 파이프라인 JSON을 stdin으로 전달
+                # (임시 pipeline.json 생성/정리 및 잔존 파일 위험 제거)
+                cmd = ["pdal", "pipeline", "--stdin"]
+
+                if pipeline_dict is None:
+                    pipeline_dict = _json_loads(pipeline_text)
+
+                # 순수 read→write(+streamable filter) 구성이면 --stream으로
+                # 전체 로드 대신 chunk 단위 실행 → 피크 RSS가 포인트 수와 무관
+                stage_types = [s.get("type") for s in pipeline_dict.get("pipeline", [])
+                               if isinstance(s, dict)]
+                if stage_types and all(s in _STREAMABLE_STAGES for s in stage_types):
+                    cmd.append("--stream")
+                    logger.info("pdal_cli_streaming", stages=stage_types)
+
+                result = subprocess.run(
+                    cmd,
+                    input=pipeline_text,
+                    capture_output=True,
+                    text=True,
+                    timeout=3600  # 1시간 타임아웃
                 )
 
+                if result.returncode != 0:
+                    logger.error("pdal_pipeline_failed",
+                               returncode=result.returncode,
+                               stderr=result.stderr[:1000] if result.stderr else "",
+                               stdout=result.stdout[:1000] if result.stdout else "",
+                               pipeline_stages=stage_types)
+                    return ConversionResult(
+                        success=False,
+                        error=f"PDAL 실행 실패: {result.stderr}"
+                    )
+
+            if progress_callback:
+                progress_callback(80)
+
             if not output_path.exists():
                 return ConversionResult(
                     success=False,
@@ -2039,6 +3626,9 @@ class SpatialConverter:
             # 메타데이터 추출
             metadata = self._get_pdal_metadata(output_path)
 
+            # 출력물 bounds를 좌표계 캐시에 선반영 (후속 단계 재스캔 방지)
+            self._seed_coord_cache(output_path, metadata)
+
             return ConversionResult(
                 success=True,
                 output_path=str(output_path),
@@ -2055,13 +3645,101 @@ class SpatialConverter:
                 success=False,
                 error=f"PDAL 실행 오류: {str(e)}"
             )
-        finally:
-            # 임시 파일 정리
-            if pipeline_file.exists():
-                pipeline_file.unlink()
+
+    def _run_pdal_pipelines_batch(
+        self,
+        pipelines: list,
+        max_workers: int = None
+    ) -> list:
+        """여러 독립 PDAL 파이프라인을 프로세스 풀로 병렬 실행
+
+        PDAL 필터 대부분은 내부적으로 단일 스레드라 파이프라인 하나는
+        코어 하나만 사용합니다. 파일 단위 배치는 프로세스 워커로 분산해야
+        코어를 채울 수 있습니다. 워커에는 pickle 가능한 파이프라인 JSON
+        문자열만 전달합니다 (self 미전달).
+
+        Returns:
+            입력 순서와 동일한 (success, error, point_count) 튜플 리스트
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if not pipelines:
+            return []
+
+        workers = max_workers or min(len(pipelines), os.cpu_count() or 1)
+        payloads = [json.dumps(p) for p in pipelines]
+
+        logger.info("pdal_batch_starting", count=len(payloads), workers=workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_execute_pipeline_json, payloads))
+
+        failed = sum(1 for success, _, _ in results if not success)
+        logger.info("pdal_batch_completed", count=len(results), failed=failed)
+        return results
 
     def _get_pdal_metadata(self, file_path: Path) -> dict:
-        """PDAL로 파일 메타데이터 추출"""
+        """PDAL로 파일 메타데이터 추출 (summary 형식)
+
+        결과는 (경로, mtime, size) 키로 캐시 — 같은 출력물을 재조회할 때
+        PDAL 재실행 대신 dict 조회로 끝남 (mtime+size로 교체 감지)
+        """
+        cache_key = self._file_cache_key(file_path)
+        if cache_key and cache_key in self._metadata_cache:
+            return self._metadata_cache[cache_key]
+
+        metadata = self._read_pdal_metadata(file_path)
+
+        if metadata and cache_key:
+            # 단순 용량 제한: 가장 오래된 항목부터 제거
+            if len(self._metadata_cache) >= 128:
+                self._metadata_cache.pop(next(iter(self._metadata_cache)))
+            self._metadata_cache[cache_key] = metadata
+
+        return metadata
+
+    def _read_pdal_metadata(self, file_path: Path) -> dict:
+        """파일에서 summary 메타데이터 실제 판독 (캐시 미스 경로)"""
+        # LAS/LAZ는 헤더(수백 바이트)에 bounds/point count가 모두 있으므로
+        # laspy 헤더 판독으로 O(1) 처리 — PDAL 기동 자체가 불필요
+        suffix = file_path.suffix.lower()
+        if suffix in (".las", ".laz"):
+            try:
+                import laspy
+                with laspy.open(str(file_path)) as reader:
+                    header = reader.header
+                    return {
+                        "summary": {
+                            "bounds": {
+                                "minx": header.mins[0],
+                                "miny": header.mins[1],
+                                "minz": header.mins[2],
+                                "maxx": header.maxs[0],
+                                "maxy": header.maxs[1],
+                                "maxz": header.maxs[2],
+                            },
+                            "num_points": header.point_count,
+                            "dimensions": ", ".join(
+                                header.point_format.dimension_names
+                            ),
+                        }
+                    }
+            except Exception as e:
+                # 헤더 판독 실패 시 PDAL 경로로 진행
+                logger.warning("laspy_header_read_failed", error=str(e))
+
+        # 바인딩이 있으면 quickinfo(헤더 preview)로 조회 — subprocess 및
+        # 방금 쓴 파일 전체 재스캔 없이 CLI summary와 같은 형태로 반환
+        ext = suffix.lstrip('.') or "las"
+        quickinfo = self._pdal_quickinfo(file_path, ext)
+        if quickinfo is not None and quickinfo.get("bounds"):
+            return {
+                "summary": {
+                    "bounds": quickinfo.get("bounds", {}),
+                    "num_points": quickinfo.get("num_points", 0),
+                    "dimensions": quickinfo.get("dimensions", ""),
+                }
+            }
+
         try:
             result = subprocess.run(
                 ["pdal", "info", "--summary", str(file_path)],
@@ -2071,7 +3749,7 @@ class SpatialConverter:
             )
 
             if result.returncode == 0:
-                return json.loads(result.stdout)
+                return _json_loads(result.stdout)
         except Exception as e:
             logger.warning("metadata_extraction_failed", error=str(e))
 
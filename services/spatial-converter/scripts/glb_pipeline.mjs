@@ -0,0 +1,42 @@
+// GLB 후처리 융합 파이프라인
+//
+// 기존에는 npx gltf-transform을 단계별(resize → webp → center)로 호출해
+// 매 단계마다 Node 기동 비용과 중간 GLB 디스크 왕복이 발생했음.
+// 이 스크립트는 문서를 한 번만 로드해 세 변환을 메모리에서 적용하고
+// 한 번만 기록함. Draco 인코더는 선택적 — 미설치 시 지오메트리 압축만 생략.
+//
+// 사용법: node glb_pipeline.mjs <input.glb> <output.glb>
+import { NodeIO } from '@gltf-transform/core';
+import { ALL_EXTENSIONS } from '@gltf-transform/extensions';
+import { center, draco, textureCompress } from '@gltf-transform/functions';
+import sharp from 'sharp';
+
+const [input, output] = process.argv.slice(2);
+if (!input || !output) {
+  console.error('usage: node glb_pipeline.mjs <input.glb> <output.glb>');
+  process.exit(2);
+}
+
+const io = new NodeIO().registerExtensions(ALL_EXTENSIONS);
+
+const transforms = [
+  // 리사이즈(2048px 상한) + WebP 압축을 한 변환으로 처리 (인코더: sharp)
+  textureCompress({ encoder: sharp, targetFormat: 'webp', resize: [2048, 2048] }),
+  // Cesium 3D Tiles용 원점 센터링 (tileset transform과의 충돌 방지)
+  center({ pivot: 'center' }),
+];
+
+try {
+  const draco3d = await import('draco3dgltf');
+  io.registerDependencies({
+    'draco3d.encoder': await draco3d.createEncoderModule(),
+    'draco3d.decoder': await draco3d.createDecoderModule(),
+  });
+  transforms.push(draco());
+} catch {
+  console.error('draco3dgltf unavailable; skipping geometry compression');
+}
+
+const doc = await io.read(input);
+await doc.transform(...transforms);
+await io.write(output, doc);
@@ -4,6 +4,11 @@ Spatial Converter API Server
 """
 
 import os
+import re
+import json
+import stat
+import time
+import types
 import asyncio
 from pathlib import Path
 from typing import Optional
@@ -11,7 +16,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 stdlib json으로 fallback
+    orjson = None
 from pydantic import BaseModel, Field
 import structlog
 import httpx
@@ -27,6 +37,10 @@ structlog.configure(
 )
 logger = structlog.get_logger()
 
+# glibc malloc arena 수 제한 — 스레드별 arena 증식으로 인한
+# 단편화/RSS 증가 완화 (프로세스 시작 전 설정되어야 효과가 있음)
+os.environ.setdefault("MALLOC_ARENA_MAX", "2")
+
 # 환경변수
 STORAGE_PATH = os.getenv("STORAGE_PATH", "/var/lib/storage")
 SUPABASE_URL = os.getenv("SUPABASE_URL", "http://kong:8000")
@@ -34,18 +48,118 @@ SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY", "")
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "*").split(",")
 CONVERTER_API_KEY = os.getenv("CONVERTER_API_KEY", "")
 
+# 변환 결과 루트 — 경로 탐색 검증에 매 요청 resolve() 하지 않도록 한 번만 해석
+OUTPUT_ROOT = Path("/app/output").resolve()
+
+# Storage 내 공간 파일 루트 — 요청마다 Path를 재조립하지 않도록 한 번만 구성
+SPATIAL_ROOT = Path(STORAGE_PATH) / "spatial-files"
+
+# 확장자별 MIME 타입 — 요청마다 dict를 재구성하지 않도록 불변 모듈 상수로 고정
+_MEDIA_TYPES = types.MappingProxyType({
+    ".ply": "application/octet-stream",
+    ".las": "application/octet-stream",
+    ".laz": "application/octet-stream",
+    ".glb": "model/gltf-binary",
+    ".gltf": "model/gltf+json",
+    ".json": "application/json",
+})
+
 # 변환기 인스턴스
 converter = SpatialConverter(storage_path=STORAGE_PATH)
 
-# 진행 중인 변환 작업 추적
-active_conversions: dict[str, ConversionStatus] = {}
+# 무거운 의존성 선로딩 + GC 동결 — prefork/리로드 환경에서 COW 페이지 보존
+SpatialConverter.warm_and_freeze()
+
+# 진행 중인 변환 작업 추적 — 완료/실패한 작업이 무한히 누적되지 않도록
+# 크기 상한 + 24시간 TTL로 제한 (cachetools 미설치 시 무제한 dict fallback)
+try:
+    from cachetools import TTLCache
+    active_conversions: "TTLCache[str, ConversionStatus]" = TTLCache(maxsize=10_000, ttl=86400)
+except ImportError:
+    active_conversions = {}  # type: ignore[assignment]
+
+# /jobs 응답 캐시 — 상태 변화가 없는 동안 반복 폴링에 같은 bytes를 반환.
+# dirty 플래그는 작업 생성/상태 전이/진행률 갱신 시 설정됨
+# (TTL 만료만으로는 무효화되지 않지만, 모니터링 용도에는 충분)
+_jobs_cache: Optional[bytes] = None
+_jobs_dirty = True
+
+
+def _mark_jobs_dirty():
+    global _jobs_dirty
+    _jobs_dirty = True
+
+
+# SSE 구독자를 깨우는 작업별 이벤트 집합 — 상태 변화가 있을 때만 push하므로
+# idle 상태의 폴링 트래픽이 0이 됨. 구독자마다 자기 Event를 등록하고
+# 자기 것만 clear()함 — 이벤트를 공유하면 한 구독자의 clear()가 다른
+# 구독자의 마지막(터미널) 알림을 지워 스트림이 영원히 멈출 수 있음
+active_events: dict[str, set[asyncio.Event]] = {}
+
+
+def _notify_job_event(job_id: str, threadsafe: bool = False):
+    """작업 상태 변화를 해당 작업의 모든 SSE 구독자에게 알림
+
+    threadsafe=True는 워커 스레드(progress_callback)에서 호출될 때 사용
+    """
+    events = tuple(active_events.get(job_id) or ())
+    if not events:
+        return
+    if threadsafe:
+        if _event_loop is not None:
+            try:
+                for event in events:
+                    _event_loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # 루프 종료 중
+    else:
+        for event in events:
+            event.set()
+
+# Supabase 상태 업데이트용 공유 HTTP 클라이언트 — lifespan에서 생성/종료.
+# 호출마다 새 클라이언트를 만들면 매번 TCP+TLS 핸드셰이크가 발생하므로
+# keep-alive 풀을 가진 단일 클라이언트를 재사용
+_http_client: Optional[httpx.AsyncClient] = None
+
+# 상태 업데이트 디바운스 큐 — 다수의 동시 변환이 5~10% 단위로 진행률을
+# 올리면 Supabase PATCH가 범람하므로, file_id별 최신 상태만 모아
+# 500ms 주기로 flush. 터미널 상태(ready/failed)는 즉시 flush
+_STATUS_FLUSH_INTERVAL = 0.5
+_STATUS_TERMINAL = frozenset({"ready", "failed"})
+_status_queue: Optional[asyncio.Queue] = None
+_status_consumer_task: Optional[asyncio.Task] = None
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """공유 AsyncClient 생성 (h2 미설치 환경에서는 HTTP/1.1 keep-alive로 fallback)"""
+    limits = httpx.Limits(max_keepalive_connections=32)
+    try:
+        return httpx.AsyncClient(http2=True, timeout=5.0, limits=limits)
+    except ImportError:
+        return httpx.AsyncClient(timeout=5.0, limits=limits)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 수명주기 관리"""
+    global _http_client, _status_queue, _status_consumer_task, _event_loop
     logger.info("spatial_converter_starting", storage_path=STORAGE_PATH)
+    _http_client = _create_http_client()
+    _event_loop = asyncio.get_running_loop()
+    _status_queue = asyncio.Queue()
+    _status_consumer_task = asyncio.create_task(_status_update_consumer())
     yield
+    # 종료 sentinel을 넣어 남은 업데이트를 flush한 뒤 consumer 종료를 대기
+    _status_queue.put_nowait(None)
+    try:
+        await asyncio.wait_for(_status_consumer_task, timeout=10.0)
+    except asyncio.TimeoutError:
+        _status_consumer_task.cancel()
+    _status_queue = None
+    _event_loop = None
+    await _http_client.aclose()
+    _http_client = None
     logger.info("spatial_converter_stopping")
 
 
@@ -129,20 +243,48 @@ def verify_api_key(request: Request):
 
 # === API Endpoints ===
 
+# PDAL 버전 캐시 — k8s liveness/readiness probe가 수 초 간격으로 /health를
+# 호출하므로 매 요청마다 fork+exec 하지 않도록 TTL을 둠
+_PDAL_VERSION_TTL = 60.0
+_PDAL_VER_RE = re.compile(r'(\d+\.\d+\.\d+)')
+_pdal_version_cache: dict = {"value": None, "expires": 0.0}
+_pdal_version_lock = asyncio.Lock()
+
+
+async def _get_pdal_version() -> str:
+    """PDAL 버전 조회 (60초 TTL 캐시, cold 캐시 시 단일 subprocess만 실행)"""
+    if time.monotonic() < _pdal_version_cache["expires"]:
+        return _pdal_version_cache["value"]
+
+    async with _pdal_version_lock:
+        # lock 대기 중 다른 요청이 갱신했으면 그대로 사용
+        if time.monotonic() < _pdal_version_cache["expires"]:
+            return _pdal_version_cache["value"]
+
+        import subprocess
+        try:
+            result = await asyncio.to_thread(
+                subprocess.run, ["pdal", "--version"], capture_output=True, text=True
+            )
+            # split() 전체 토큰화 대신 정규식으로 버전 토큰만 추출
+            # (출력 포맷이 달라져도 IndexError 없이 "unknown"으로 처리)
+            m = _PDAL_VER_RE.search(result.stdout) if result.returncode == 0 else None
+            pdal_version = m.group(1) if m else "unknown"
+        except Exception:
+            pdal_version = "not installed"
+
+        _pdal_version_cache["value"] = pdal_version
+        _pdal_version_cache["expires"] = time.monotonic() + _PDAL_VERSION_TTL
+        return pdal_version
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """헬스체크 엔드포인트"""
-    import subprocess
-    try:
-        result = subprocess.run(["pdal", "--version"], capture_output=True, text=True)
-        pdal_version = result.stdout.split()[2] if result.returncode == 0 else "unknown"
-    except Exception:
-        pdal_version = "not installed"
-
     return HealthResponse(
         status="healthy",
         version="1.0.0",
-        pdal_version=pdal_version
+        pdal_version=await _get_pdal_version()
     )
 
 
@@ -166,7 +308,7 @@ async def delete_storage_files(request: DeleteRequest, raw_request: Request):
                 continue
 
             # 전체 경로 구성
-            full_path = Path(STORAGE_PATH) / "spatial-files" / storage_path
+            full_path = SPATIAL_ROOT / storage_path
 
             # 경로가 STORAGE_PATH 내부인지 확인
             try:
@@ -224,16 +366,24 @@ async def start_conversion(
             )
 
     # 원본 파일 존재 확인 (Supabase는 디렉토리 안에 UUID 파일로 저장)
-    source_dir = Path(STORAGE_PATH) / "spatial-files" / request.source_path
+    # stat 한 번으로 존재/디렉토리/파일 판별을 모두 처리
+    source_dir = SPATIAL_ROOT / request.source_path
     source_full_path = None
     original_format = None
     original_name = None
 
-    if source_dir.is_dir():
+    try:
+        source_stat = os.stat(source_dir)
+    except OSError:
+        source_stat = None
+
+    if source_stat and stat.S_ISDIR(source_stat.st_mode):
         # 디렉토리 안의 첫 번째 파일 찾기 (UUID 이름의 실제 파일)
-        files = list(source_dir.iterdir())
-        if files:
-            source_full_path = files[0]
+        # 전체 목록 대신 첫 엔트리만 필요하므로 scandir로 조기 종료
+        with os.scandir(source_dir) as it:
+            entry = next(iter(it), None)
+        if entry is not None:
+            source_full_path = Path(entry.path)
         # 디렉토리 이름에서 원본 확장자 추출 (예: "file.obj" → "obj")
         dir_name = source_dir.name
         if '.' in dir_name:
@@ -243,13 +393,13 @@ async def start_conversion(
                 original_name = dir_name.split('________', 1)[-1]
             else:
                 original_name = dir_name
-    elif source_dir.is_file():
+    elif source_stat and stat.S_ISREG(source_stat.st_mode):
         # 직접 파일인 경우
         source_full_path = source_dir
         original_format = source_dir.suffix.lstrip('.').lower()
         original_name = source_dir.name
 
-    if not source_full_path or not source_full_path.exists():
+    if not source_full_path:
         raise HTTPException(
             status_code=404,
             detail=f"원본 파일을 찾을 수 없습니다: {request.source_path}"
@@ -268,6 +418,7 @@ async def start_conversion(
         status="pending",
         progress=0
     )
+    _mark_jobs_dirty()
 
     # 옵션에 원본 정보 추가 (요청에 없는 경우에만)
     options = request.options or {}
@@ -321,55 +472,106 @@ async def get_conversion_status(job_id: str):
     )
 
 
+@app.get("/status/{job_id}/stream")
+async def stream_conversion_status(job_id: str):
+    """변환 상태 SSE 스트림 — 상태가 실제로 바뀔 때만 이벤트 push
+
+    폴링(/status) 대비 idle 트래픽이 없고, 변화당 최대 1개 메시지만 전송.
+    기존 폴링 엔드포인트는 호환성을 위해 유지됨.
+    """
+    if job_id not in active_conversions:
+        raise HTTPException(
+            status_code=404,
+            detail=f"변환 작업을 찾을 수 없습니다: {job_id}"
+        )
+
+    # 구독자 전용 Event — 알림은 작업의 모든 구독자 이벤트를 set()하고,
+    # 각 구독자는 자기 이벤트만 clear()하므로 알림 유실 경합이 없음
+    event = asyncio.Event()
+    active_events.setdefault(job_id, set()).add(event)
+
+    async def event_stream():
+        try:
+            while True:
+                status = active_conversions.get(job_id)
+                if status is None:
+                    return
+                payload = {
+                    "job_id": status.job_id,
+                    "file_id": status.file_id,
+                    "status": status.status,
+                    "progress": status.progress,
+                    "output_path": status.output_path,
+                    "error": status.error,
+                }
+                data = orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+                yield b"data: " + data + b"\n\n"
+                if status.status in ("ready", "failed"):
+                    return
+                await event.wait()
+                event.clear()
+        finally:
+            subscribers = active_events.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(event)
+                if not subscribers:
+                    active_events.pop(job_id, None)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.get("/jobs")
 async def list_jobs():
-    """모든 변환 작업 목록"""
-    return {
-        "jobs": [
-            {
-                "job_id": s.job_id,
-                "file_id": s.file_id,
-                "status": s.status,
-                "progress": s.progress
-            }
-            for s in active_conversions.values()
-        ]
-    }
+    """모든 변환 작업 목록 (상태 변화가 없으면 캐시된 직렬화 결과 재사용)"""
+    global _jobs_cache, _jobs_dirty
+    if _jobs_dirty or _jobs_cache is None:
+        # TTL 만료가 반복 중 크기를 바꾸지 않도록 스냅샷 후 직렬화
+        snapshot = list(active_conversions.values())
+        payload = {
+            "jobs": [
+                {
+                    "job_id": s.job_id,
+                    "file_id": s.file_id,
+                    "status": s.status,
+                    "progress": s.progress
+                }
+                for s in snapshot
+            ]
+        }
+        _jobs_cache = orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+        _jobs_dirty = False
+    return Response(content=_jobs_cache, media_type="application/json")
 
 
 @app.get("/output/{file_path:path}")
 async def download_converted_file(file_path: str):
     """변환된 파일 다운로드 (하위 디렉토리 지원)"""
-    output_path = Path("/app/output") / file_path
+    output_path = OUTPUT_ROOT / file_path
 
     # 보안: output 디렉토리 밖으로 경로 조작 방지
-    try:
-        output_path.resolve().relative_to(Path("/app/output").resolve())
-    except ValueError:
+    if not output_path.resolve(strict=False).is_relative_to(OUTPUT_ROOT):
         raise HTTPException(status_code=403, detail="잘못된 경로입니다")
 
-    if not output_path.exists():
+    # 존재 확인과 응답용 stat을 syscall 한 번으로 처리
+    try:
+        st = os.stat(output_path)
+    except OSError:
         raise HTTPException(
             status_code=404,
             detail=f"파일을 찾을 수 없습니다: {file_path}"
         )
 
     # 파일 확장자에 따른 MIME 타입 설정
-    ext = output_path.suffix.lower()
-    media_types = {
-        ".ply": "application/octet-stream",
-        ".las": "application/octet-stream",
-        ".laz": "application/octet-stream",
-        ".glb": "model/gltf-binary",
-        ".gltf": "model/gltf+json",
-        ".json": "application/json",
-    }
-    media_type = media_types.get(ext, "application/octet-stream")
+    media_type = _MEDIA_TYPES.get(output_path.suffix.lower(), "application/octet-stream")
 
+    # stat_result 전달로 FileResponse 내부의 중복 stat 생략,
+    # inode 기반 ETag로 브라우저 재요청 시 304 처리 유도
     return FileResponse(
         path=str(output_path),
         media_type=media_type,
-        filename=output_path.name
+        filename=output_path.name,
+        stat_result=st,
+        headers={"etag": f'"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"'},
     )
 
 
@@ -384,9 +586,13 @@ async def run_conversion(
 ):
     """백그라운드 변환 작업 실행"""
     try:
-        # 상태 업데이트: 변환 중
-        active_conversions[job_id].status = "converting"
-        active_conversions[job_id].progress = 10
+        # 상태 업데이트: 변환 중 (TTL 만료로 항목이 사라졌을 수 있어 get으로 접근)
+        job = active_conversions.get(job_id)
+        if job:
+            job.status = "converting"
+            job.progress = 10
+            _mark_jobs_dirty()
+            _notify_job_event(job_id)
 
         # DB 상태 업데이트 (선택적)
         await update_file_conversion_status(file_id, "converting", 10)
@@ -402,9 +608,14 @@ async def run_conversion(
 
         if result.success:
             # 성공
-            active_conversions[job_id].status = "ready"
-            active_conversions[job_id].progress = 100
-            active_conversions[job_id].output_path = result.output_path
+            job = active_conversions.get(job_id)
+            if job:
+                job.status = "ready"
+                job.progress = 100
+                job.output_path = result.output_path
+                _mark_jobs_dirty()
+                _notify_job_event(job_id)
+                active_events.pop(job_id, None)
 
             # 공간 정보 포함하여 DB 업데이트
             spatial_info = result.metadata.get("spatialInfo") if result.metadata else None
@@ -422,8 +633,13 @@ async def run_conversion(
             )
         else:
             # 실패
-            active_conversions[job_id].status = "failed"
-            active_conversions[job_id].error = result.error
+            job = active_conversions.get(job_id)
+            if job:
+                job.status = "failed"
+                job.error = result.error
+                _mark_jobs_dirty()
+                _notify_job_event(job_id)
+                active_events.pop(job_id, None)
 
             await update_file_conversion_status(file_id, "failed", 0, error=result.error)
 
@@ -435,8 +651,13 @@ async def run_conversion(
             )
 
     except Exception as e:
-        active_conversions[job_id].status = "failed"
-        active_conversions[job_id].error = str(e)
+        job = active_conversions.get(job_id)
+        if job:
+            job.status = "failed"
+            job.error = str(e)
+            _mark_jobs_dirty()
+            _notify_job_event(job_id)
+            active_events.pop(job_id, None)
 
         await update_file_conversion_status(file_id, "failed", 0, error=str(e))
 
@@ -448,10 +669,52 @@ async def run_conversion(
 
 
 def update_progress(job_id: str, file_id: str, progress: int):
-    """진행률 업데이트"""
+    """진행률 업데이트 (워커 스레드에서 호출됨)"""
     if job_id in active_conversions:
         active_conversions[job_id].progress = progress
-    # 비동기 DB 업데이트는 생략 (빈번한 업데이트 방지)
+        _mark_jobs_dirty()
+        _notify_job_event(job_id, threadsafe=True)
+    # 디바운스 큐가 PATCH를 병합하므로 DB 진행률도 부담 없이 반영.
+    # 워커 스레드이므로 이벤트 루프에 thread-safe하게 enqueue
+    if _status_queue is not None and _event_loop is not None:
+        payload = {
+            "file_id": file_id,
+            "status": "converting",
+            "progress": progress,
+        }
+        try:
+            _event_loop.call_soon_threadsafe(_status_queue.put_nowait, payload)
+        except RuntimeError:
+            pass  # 루프 종료 중 — 진행률 업데이트는 유실돼도 무방
+
+
+async def _status_update_consumer():
+    """상태 업데이트 큐 consumer — file_id별 최신 상태를 병합해 주기적으로 flush"""
+    pending: dict[str, dict] = {}
+
+    async def flush():
+        for payload in pending.values():
+            await _patch_file_conversion_status(**payload)
+        pending.clear()
+
+    while True:
+        try:
+            item = await asyncio.wait_for(
+                _status_queue.get(), timeout=_STATUS_FLUSH_INTERVAL
+            )
+        except asyncio.TimeoutError:
+            if pending:
+                await flush()
+            continue
+
+        if item is None:
+            # 종료 sentinel — 남은 업데이트를 모두 내보내고 종료
+            await flush()
+            return
+
+        pending[item["file_id"]] = item
+        if item["status"] in _STATUS_TERMINAL:
+            await flush()
 
 
 async def update_file_conversion_status(
@@ -462,13 +725,46 @@ async def update_file_conversion_status(
     error: Optional[str] = None,
     metadata: Optional[dict] = None
 ):
-    """Supabase DB 파일 변환 상태 업데이트"""
+    """Supabase DB 파일 변환 상태 업데이트 (디바운스 큐 경유)
+
+    큐가 없는 환경(lifespan 밖, 테스트)에서는 직접 PATCH로 fallback
+    """
+    payload = {
+        "file_id": file_id,
+        "status": status,
+        "progress": progress,
+        "output_path": output_path,
+        "error": error,
+        "metadata": metadata,
+    }
+    if _status_queue is None:
+        await _patch_file_conversion_status(**payload)
+    else:
+        _status_queue.put_nowait(payload)
+
+
+async def _patch_file_conversion_status(
+    file_id: str,
+    status: str,
+    progress: int,
+    output_path: Optional[str] = None,
+    error: Optional[str] = None,
+    metadata: Optional[dict] = None
+):
+    """Supabase DB에 변환 상태를 실제로 PATCH"""
     if not SUPABASE_SERVICE_KEY:
         logger.warning("supabase_service_key_not_set", file_id=file_id)
         return
 
     try:
-        async with httpx.AsyncClient() as client:
+        # lifespan에서 만든 공유 클라이언트 재사용 (연결 풀/keep-alive 활용)
+        # lifespan 밖에서 호출되는 경우(테스트 등)에만 일회성 클라이언트 생성
+        client = _http_client
+        close_after = client is None
+        if close_after:
+            client = _create_http_client()
+
+        try:
             update_data = {
                 "conversion_status": status,
                 "conversion_progress": progress,
@@ -508,6 +804,9 @@ async def update_file_conversion_status(
                     status_code=response.status_code,
                     response_text=response.text[:200] if response.text else ""
                 )
+        finally:
+            if close_after:
+                await client.aclose()
     except Exception as e:
         logger.warning("db_update_error", file_id=file_id, error=str(e))
 